@@ -28,10 +28,16 @@ import json
 import logging
 import os
 import sqlite3
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple
 
+# Add the project root to the path so the app's decoders can be reused
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.db.memory_db import decode_invoice_data  # noqa: E402
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger("backfill")
 
@@ -166,6 +172,8 @@ def main():
 
     for transaction_id, invoice_json, audit_trail_json, created_at in rows:
         try:
+            # invoice_data is zstd-compressed JSON (BLOB) in newer rows, plain JSON text in older ones
+            invoice_json = decode_invoice_data(invoice_json)
             invoice_payload = json.loads(invoice_json) if isinstance(invoice_json, str) else invoice_json
         except Exception:
             logger.warning(f"Malformed invoice JSON for {transaction_id}; skipping")
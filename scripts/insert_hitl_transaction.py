@@ -52,6 +52,7 @@ row = (
     0,                                        # human_override (pending)
     2500,                                     # processing_time_ms
     json.dumps(audit_trail),                  # audit_trail
+    1 if audit_trail else 0,                  # has_audit
     "demo-hitl",                             # trace_id
     now,                                      # created_at
     now,                                      # updated_at
@@ -66,8 +67,8 @@ cursor.execute(
     INSERT INTO transactions
     (transaction_id, invoice_id, invoice_data, risk_score, risk_level,
      paa_decision, policy_check_json, final_decision, decision_reasoning, human_override,
-     processing_time_ms, audit_trail, trace_id, created_at, updated_at, source_document_path)
-    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+     processing_time_ms, audit_trail, has_audit, trace_id, created_at, updated_at, source_document_path)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     """,
     row,
 )
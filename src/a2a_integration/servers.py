@@ -10,7 +10,7 @@ from starlette.applications import Starlette
 
 from ..agents.ema.agent_executor import EMAExecutor
 from ..agents.paa.agent_executor import PAAExecutor
-from ..core.config import Settings
+from ..core.config import SettingsSnapshot
 
 
 def _build_agent_card(
@@ -61,7 +61,7 @@ def _build_server(
     return server.build()
 
 
-def create_paa_a2a_app(settings: Settings) -> Starlette:
+def create_paa_a2a_app(settings: SettingsSnapshot) -> Starlette:
     base_url = settings.a2a_base_url.rstrip("/") + settings.a2a_paa_path
     agent_card = _build_agent_card(
         name="Policy Adherence Agent (PAA)",
@@ -74,7 +74,7 @@ def create_paa_a2a_app(settings: Settings) -> Starlette:
     return _build_server(executor_factory=PAAExecutor, agent_card=agent_card)
 
 
-def create_ema_a2a_app(settings: Settings) -> Starlette:
+def create_ema_a2a_app(settings: SettingsSnapshot) -> Starlette:
     base_url = settings.a2a_base_url.rstrip("/") + settings.a2a_ema_path
     agent_card = _build_agent_card(
         name="Exception Manager Agent (EMA)",
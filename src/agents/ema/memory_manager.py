@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Sequence, Any
 
 from ...core.config import get_settings
 from ...db.memory_db import MemoryDatabase
@@ -111,6 +111,10 @@ class MemoryManager:
         """Update exception usage statistics."""
         self.db.update_exception_usage(exception_id, success)
 
+    def update_exceptions_usage(self, exception_ids: Sequence[str], success: bool = True) -> None:
+        """Update usage statistics of several exceptions in one write."""
+        self.db.update_exceptions_usage(exception_ids, success)
+
     def get_context_retention_score(self) -> float:
         """Calculate the current Context Retention Score (CRS).
 
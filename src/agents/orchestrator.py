@@ -8,7 +8,7 @@ import logging
 import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 from urllib.parse import urljoin
 
 import httpx
@@ -300,8 +300,10 @@ class AFGAOrchestrator:
     def get_transaction(self, transaction_id: str) -> Optional[Dict[str, Any]]:
         return self.memory_db.get_transaction(transaction_id)
 
-    def get_recent_transactions(self, limit: int = 10) -> list[Dict[str, Any]]:
-        return self.memory_db.get_recent_transactions(limit)
+    def get_recent_transactions(
+        self, limit: int = 10, columns: Optional[Sequence[str]] = None
+    ) -> list[Dict[str, Any]]:
+        return self.memory_db.get_recent_transactions(limit, columns)
 
     def get_kpis(
         self,
@@ -376,10 +376,12 @@ REASONING: [detailed explanation]
                         label = f"{base_label} (Manual review required)"
                     applied_exception_records.append((label, exc.exception_id))
                     applied_exception_ids.append(exc.exception_id)
-                    try:
-                        self.memory_manager.update_exception_usage(exc.exception_id)
-                    except Exception as update_err:
-                        logger.warning(f"Failed to update usage for exception {exc.exception_id}: {update_err}")
+
+            if applied_exception_ids:
+                try:
+                    self.memory_manager.update_exceptions_usage(applied_exception_ids)
+                except Exception as update_err:
+                    logger.warning(f"Failed to update usage for exceptions {applied_exception_ids}: {update_err}")
 
             if applied_exception_records:
                 applied_exceptions = [record[0] for record in applied_exception_records]
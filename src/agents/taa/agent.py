@@ -95,7 +95,7 @@ class TransactionAuditorAgent:
                     agent_name="TAA",
                     step_name="assess_risk",
                     input_data={"invoice_id": invoice.invoice_id},
-                    output_data=risk_assessment.model_dump(),
+                    output_data=risk_assessment,
                 )
 
         except Exception as e:
@@ -1,8 +1,8 @@
 """FastAPI application for AFGA.
 
-Enhancement: automatically load environment variables from a `.env` file so
-Databricks + other integrations work without manual shell export before app start.
-This ensures similarity search endpoint sees Databricks vars that tests rely on.
+Environment variables from a `.env` file are loaded by ``core.config`` at import
+(without overriding exported ones), so Databricks + other integrations work without
+manual shell export before app start.
 """
 
 from __future__ import annotations
@@ -11,14 +11,13 @@ import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from dotenv import load_dotenv
 from fastapi.middleware.cors import CORSMiddleware
 
 from ..a2a_integration.servers import create_ema_a2a_app, create_paa_a2a_app
 from ..core.config import get_settings
 from ..core.logging_config import setup_logging
-from ..core.observability import Observability
-from .routes import router
+from ..core.openrouter_client import close_openrouter_client
+from .routes import get_orch_cached, router
 
 
 # Setup logging
@@ -35,25 +34,20 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down AFGA")
-    # Flush Langfuse events if configured
-    settings = get_settings()
-    if settings.langfuse_public_key and settings.langfuse_secret_key:
+    # Flush Langfuse events if configured; the drain queue is shared by every request's
+    # orchestrator, so flushing the live one waits for all queued spans and trace ends
+    observability = get_orch_cached().observability
+    if observability.enabled:
         try:
-            obs = Observability()
-            obs.flush()
+            observability.flush()
             logger.info("Langfuse events flushed on shutdown")
         except Exception as e:
             logger.warning(f"Failed to flush Langfuse on shutdown: {e}")
+    close_openrouter_client()
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
-    # Load .env early (non-destructive: does not override already-set vars)
-    try:
-        load_dotenv(override=False)
-        logger.info("Loaded .env for application environment variables")
-    except Exception as env_err:  # pragma: no cover
-        logger.warning(f"Failed to load .env: {env_err}")
     settings = get_settings()
     app = FastAPI(
         title="Adaptive Finance Governance Agent (AFGA)",
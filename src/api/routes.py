@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import json
 import logging
+import mimetypes
+import os
 import shutil
+import time
+from email.utils import formatdate
+from functools import cache
 from pathlib import Path
 from typing import List, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, status, UploadFile, File
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status, UploadFile, File
 from fastapi.responses import FileResponse
 from urllib.parse import quote
 
@@ -31,6 +37,7 @@ from ..models.schemas import (
     ProcessPendingResponse,
     ProcessPendingItem,
 )
+from ..db.memory_db import TRANSACTION_SUMMARY_COLUMNS, decode_invoice_data
 from ..models.memory_schemas import MemoryQuery, MemoryStats
 from ..services import KPITracker
 from ..services.invoice_extractor import InvoiceExtractor
@@ -42,6 +49,7 @@ from ..services.databricks_embeddings import (
 )
 from ..services.databricks_sink import get_databricks_sink
 from ..services.similarity_advisor import get_similarity_advisor
+from ..core.openrouter_client import OpenRouterClient, get_openrouter_client
 from ..governance import GovernedLLMClient
 
 
@@ -86,9 +94,9 @@ def _coerce_json(value):
         return value
     if isinstance(value, str):
         try:
-            return json.loads(value)
-        except json.JSONDecodeError:
-            logger.warning("Failed to json.loads value; returning raw string", exc_info=True)
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            logger.warning("Failed to parse JSON value; returning raw string", exc_info=True)
             return value
     return value
 
@@ -256,25 +264,14 @@ def databricks_backfill(limit: int = 500, force: bool = False, dry_run: bool = F
         dry_run: Only report what would be uploaded
         skip_duplicates: If True, do not re-upload invoices whose content hash already exists
     """
-    import sqlite3
     sink = get_databricks_sink()
     if not sink.enabled:
         raise HTTPException(status_code=503, detail="Databricks sink disabled (missing AZURE_STORAGE_CONNECTION_STRING)")
 
     memory_db = get_orch_cached().memory_db
-    conn = sqlite3.connect(memory_db.db_path)
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        SELECT transaction_id, invoice_data, audit_trail, created_at
-        FROM transactions
-        ORDER BY created_at ASC
-        LIMIT ?
-        """,
-        (limit,),
+    _, rows = memory_db.get_recent_transactions_columnar(
+        limit, ["transaction_id", "invoice_data", "audit_trail", "created_at"], oldest_first=True
     )
-    rows = cursor.fetchall()
-    conn.close()
 
     uploaded = 0
     skipped = 0
@@ -287,7 +284,8 @@ def databricks_backfill(limit: int = 500, force: bool = False, dry_run: bool = F
     for transaction_id, invoice_json, audit_trail_json, created_at in rows:
         # Parse invoice JSON
         try:
-            invoice_dict = json.loads(invoice_json) if isinstance(invoice_json, str) else invoice_json
+            invoice_json = decode_invoice_data(invoice_json)
+            invoice_dict = orjson.loads(invoice_json) if isinstance(invoice_json, str) else invoice_json
             if isinstance(invoice_dict, dict) and "invoice" in invoice_dict and isinstance(invoice_dict["invoice"], dict):
                 # Some rows may already be wrapped with 'invoice'
                 invoice_payload = invoice_dict["invoice"]
@@ -322,7 +320,7 @@ def databricks_backfill(limit: int = 500, force: bool = False, dry_run: bool = F
 
         # Upload agent trail if present
         try:
-            audit_trail = json.loads(audit_trail_json) if isinstance(audit_trail_json, str) else audit_trail_json
+            audit_trail = orjson.loads(audit_trail_json) if isinstance(audit_trail_json, str) else audit_trail_json
         except Exception:
             audit_trail = []
         if isinstance(audit_trail, list) and audit_trail:
@@ -585,16 +583,17 @@ def process_pending_transactions(request: ProcessPendingRequest):
     attempted = len(entries)
 
     if request.dry_run or not entries:
-        items = [
-            ProcessPendingItem(
-                pending_id=entry["pending_id"],
-                status="dry_run" if request.dry_run else "skipped",
-                invoice_id=_coerce_json(entry.get("invoice_data") or {}).get("invoice_id")
-                if isinstance(_coerce_json(entry.get("invoice_data")), dict)
-                else None,
+        items = []
+        for entry in entries:
+            # Parse each queued invoice once; only its id is reported
+            invoice_payload = _coerce_json(entry.get("invoice_data"))
+            items.append(
+                ProcessPendingItem(
+                    pending_id=entry["pending_id"],
+                    status="dry_run" if request.dry_run else "skipped",
+                    invoice_id=invoice_payload.get("invoice_id") if isinstance(invoice_payload, dict) else None,
+                )
             )
-            for entry in entries
-        ]
         remaining = total_pending_before if request.dry_run else total_pending_before
         return ProcessPendingResponse(
             total_pending_before=total_pending_before,
@@ -616,8 +615,8 @@ def process_pending_transactions(request: ProcessPendingRequest):
         trace_id = entry.get("trace_id")
 
         try:
-            invoice_data = json.loads(invoice_payload)
-        except json.JSONDecodeError:
+            invoice_data = orjson.loads(invoice_payload)
+        except orjson.JSONDecodeError:
             invoice_data = {}
 
         invoice_id = invoice_data.get("invoice_id") if isinstance(invoice_data, dict) else None
@@ -676,6 +675,8 @@ def process_pending_transactions(request: ProcessPendingRequest):
                 )
             )
 
+    # Flush the batch's WAL frames now rather than inline with a later request's commit
+    memory_db.checkpoint()
     remaining = memory_db.count_pending_transactions()
 
     return ProcessPendingResponse(
@@ -711,14 +712,17 @@ def get_transaction(transaction_id: str):
 
 
 @router.get("/transactions", response_model=List[dict])
-def list_transactions(limit: int = 10, decision_filter: Optional[str] = None):
+def list_transactions(limit: int = 10, decision_filter: Optional[str] = None, summary: bool = False):
     """List recent transactions with optional filtering.
     
     Args:
         limit: Maximum number of transactions to return
         decision_filter: Filter by decision type (APPROVED, REJECTED, HITL)
+        summary: Return only metadata columns, skipping the invoice, policy check and audit trail
     """
-    transactions = get_orch_cached().get_recent_transactions(limit=limit)
+    transactions = get_orch_cached().get_recent_transactions(
+        limit=limit, columns=TRANSACTION_SUMMARY_COLUMNS if summary else None
+    )
 
     # Apply decision filter if specified
     if decision_filter:
@@ -851,52 +855,19 @@ def get_classifications_summary():
     
     Returns counts and percentages for each decision type (APPROVED, REJECTED, HITL).
     """
-    import sqlite3
     try:
-        memory_db = get_orch_cached().memory_db
-        conn = sqlite3.connect(memory_db.db_path)
-        cursor = conn.cursor()
-        
-        # Get decision counts
-        cursor.execute("""
-            SELECT 
-                final_decision,
-                COUNT(*) as count,
-                AVG(risk_score) as avg_risk_score,
-                AVG(processing_time_ms) as avg_processing_time
-            FROM transactions
-            GROUP BY final_decision
-        """)
-        
-        decision_stats = {}
-        total_count = 0
-        
-        for row in cursor.fetchall():
-            decision = row[0]
-            count = row[1]
-            decision_stats[decision] = {
-                "count": count,
-                "avg_risk_score": round(row[2], 2) if row[2] else 0,
-                "avg_processing_time_ms": round(row[3], 2) if row[3] else 0,
-            }
-            total_count += count
-        
-        # Add percentages
-        for decision in decision_stats:
-            decision_stats[decision]["percentage"] = round(
-                (decision_stats[decision]["count"] / total_count * 100), 2
-            ) if total_count > 0 else 0
-        
-        # Get HITL specific stats
-        cursor.execute("""
-            SELECT COUNT(*) 
-            FROM transactions 
-            WHERE LOWER(final_decision) = 'hitl' AND human_override = 0
-        """)
-        pending_hitl = cursor.fetchone()[0]
-        
-        conn.close()
-        
+        decision_stats = get_orch_cached().memory_db.get_decision_stats()
+        total_count = sum(stats["count"] for stats in decision_stats.values())
+        pending_hitl = 0
+
+        for stats in decision_stats.values():
+            pending_hitl += stats.pop("pending_hitl")
+            stats["avg_risk_score"] = round(stats["avg_risk_score"], 2) if stats["avg_risk_score"] else 0
+            stats["avg_processing_time_ms"] = (
+                round(stats["avg_processing_time_ms"], 2) if stats["avg_processing_time_ms"] else 0
+            )
+            stats["percentage"] = round((stats["count"] / total_count * 100), 2) if total_count > 0 else 0
+
         return {
             "total_transactions": total_count,
             "decision_stats": decision_stats,
@@ -919,6 +890,8 @@ def list_memory_exceptions(
     vendor: Optional[str] = None,
     category: Optional[str] = None,
     rule_type: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1),
+    after_id: Optional[str] = None,
 ):
     """List exceptions in adaptive memory.
 
@@ -926,12 +899,16 @@ def list_memory_exceptions(
         vendor: Filter by vendor
         category: Filter by category
         rule_type: Filter by rule type
+        limit: Page size (default: all matching exceptions)
+        after_id: Last exception_id of the previous page, to fetch the next one
     """
     try:
         query = MemoryQuery(
             vendor=vendor,
             category=category,
             rule_type=rule_type,
+            limit=limit,
+            after_id=after_id,
         )
 
         exceptions = get_orch_cached().memory_db.query_exceptions(query)
@@ -1006,33 +983,7 @@ def restore_exception(exception_id: str):
 def list_deleted_exceptions():
     """List soft-deleted exceptions."""
     try:
-        db_path = get_orch_cached().memory_db.db_path
-        import sqlite3
-
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT * FROM adaptive_memory
-            WHERE is_active = 0
-            ORDER BY deleted_at DESC
-        """)
-
-        rows = cursor.fetchall()
-        conn.close()
-
-        # Convert to dicts manually (avoid MemoryException import issues)
-        exceptions = []
-        for row in rows:
-            row_dict = dict(row)
-            # Parse condition JSON
-            try:
-                row_dict["condition"] = json.loads(row_dict.get("condition", "{}"))
-            except:
-                row_dict["condition"] = {}
-            exceptions.append(row_dict)
-
+        exceptions = get_orch_cached().memory_db.get_deleted_exceptions()
         return {"exceptions": exceptions}
 
     except Exception as e:
@@ -1074,7 +1025,8 @@ def upload_memory_snapshot():
 
         memory_db = get_orch_cached().memory_db
         query = MemoryQuery()
-        exceptions = memory_db.query_exceptions(query)
+        # Stream rows straight into the export payload instead of materializing the rule list first
+        exceptions = memory_db.iter_exceptions(query)
         
         exceptions_data = [
             {
@@ -1273,8 +1225,22 @@ def get_langfuse_overview():
         )
 
 
+@cache
+def _get_assistant_llm_client(llm_client: OpenRouterClient) -> GovernedLLMClient:
+    return GovernedLLMClient(agent_name="GovernanceAssistant", llm_client=llm_client)
+
+
+def get_assistant_llm_client(
+    llm_client: OpenRouterClient = Depends(get_openrouter_client),
+) -> GovernedLLMClient:
+    """Governed assistant client, built once per shared OpenRouter client (with its audit logger and validators)."""
+    return _get_assistant_llm_client(llm_client)
+
+
 @router.post("/assistant/chat", response_model=AssistantChatResponse)
-def assistant_chat(request: AssistantChatRequest) -> AssistantChatResponse:
+def assistant_chat(
+    request: AssistantChatRequest, client: GovernedLLMClient = Depends(get_assistant_llm_client)
+) -> AssistantChatResponse:
     """Handle governance assistant chat requests."""
     logger.info("Assistant chat request received for page=%s", request.page)
 
@@ -1364,7 +1330,6 @@ def assistant_chat(request: AssistantChatRequest) -> AssistantChatResponse:
         if entry.role in {"user", "assistant"}
     ]
 
-    client = GovernedLLMClient(agent_name="GovernanceAssistant")
     try:
         reply = client.completion(
             prompt=prompt,
@@ -1391,11 +1356,6 @@ def assistant_chat(request: AssistantChatRequest) -> AssistantChatResponse:
     except Exception as exc:
         logger.error("Assistant chat failed: %s", exc, exc_info=True)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Assistant chat failed: {exc}")
-    finally:
-        try:
-            client.close()
-        except Exception:
-            pass
 
     # Build sources for UI transparency
     sources: List[AssistantChatSource] = []
@@ -1416,40 +1376,121 @@ def assistant_chat(request: AssistantChatRequest) -> AssistantChatResponse:
         )
 
     for match in memory_matches:
-        snippet_parts = [match.get("description") or "Learned rule"]
-        vendor = match.get("vendor")
-        category = match.get("category")
-        if vendor or category:
-            snippet_parts.append(
-                " | ".join(
-                    filter(
-                        None, [f"Vendor: {vendor}" if vendor else None, f"Category: {category}" if category else None]
-                    )
-                )
-            )
-        snippet_parts.append(f"Applied {match.get('applied_count', 0)} time(s)")
+        description = match.get("description") or "Learned rule"
+        scope_fields = (("Vendor", match.get("vendor")), ("Category", match.get("category")))
+        scope = " | ".join(f"{label}: {value}" for label, value in scope_fields if value)
+        applied = f"Applied {match.get('applied_count', 0)} time(s)"
         sources.append(
             AssistantChatSource(
                 type="memory_rule",
                 id=str(match.get("exception_id")),
                 title=match.get("description", "Adaptive memory rule"),
-                snippet="; ".join(snippet_parts),
+                snippet=f"{description}; {scope}; {applied}" if scope else f"{description}; {applied}",
             )
         )
 
     return AssistantChatResponse(reply=reply.strip(), sources=sources)
 
 
+class _PolicyFileIndex:
+    """In-memory index of servable policy files, keyed by file name.
+
+    The policies directory is resolved once and scanned with ``os.scandir``;
+    only regular files that resolve inside it are indexed, so lookups need no
+    per-request filesystem access or traversal checks. The index is rebuilt
+    when it is older than ``ttl_seconds`` or (rate-limited) on a miss.
+    """
+
+    def __init__(self, policies_dir: Path, ttl_seconds: float = 60.0, miss_refresh_seconds: float = 1.0):
+        self.root = policies_dir.resolve()
+        self.ttl_seconds = ttl_seconds
+        self.miss_refresh_seconds = miss_refresh_seconds
+        self._entries: dict[str, str] = {}
+        self._loaded_at = 0.0
+        self.refresh()
+
+    def refresh(self) -> None:
+        entries: dict[str, str] = {}
+        try:
+            with os.scandir(self.root) as it:
+                for entry in it:
+                    if entry.is_file() and Path(entry.path).resolve().is_relative_to(self.root):
+                        entries[entry.name] = entry.path
+        except FileNotFoundError:
+            logger.warning("Policies directory %s does not exist", self.root)
+        self._entries = entries
+        self._loaded_at = time.monotonic()
+
+    def get(self, name: str) -> Optional[str]:
+        age = time.monotonic() - self._loaded_at
+        if age > self.ttl_seconds:
+            self.refresh()
+        path = self._entries.get(name)
+        if path is None and age > self.miss_refresh_seconds:
+            self.refresh()
+            path = self._entries.get(name)
+        return path
+
+
+_policy_file_index: Optional[_PolicyFileIndex] = None
+
+
+def _get_policy_file_index(policies_dir: Path) -> _PolicyFileIndex:
+    global _policy_file_index
+    if _policy_file_index is None or _policy_file_index.root != policies_dir.resolve():
+        _policy_file_index = _PolicyFileIndex(policies_dir)
+    return _policy_file_index
+
+
+_POLICY_MEDIA_TYPES = {".txt": "text/plain", ".md": "text/markdown", ".pdf": "application/pdf"}
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110 §13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
 @router.get("/policies/{policy_filename}")
-def download_policy(policy_filename: str):
-    """Serve policy document content for transparency links."""
+def download_policy(policy_filename: str, request: Request):
+    """Serve policy document content for transparency links.
+
+    Responses carry an mtime/size based ETag and Last-Modified so repeat
+    requests with a matching If-None-Match get a 304 without a body.
+    """
     policy_retriever = getattr(_startup_orch.policy_mcp, "policy_retriever", None)
     if not policy_retriever:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Policy retriever not available")
 
     safe_name = Path(policy_filename).name
-    policy_path = policy_retriever.policies_dir / safe_name
-    if not policy_path.exists():
+    policy_index = _get_policy_file_index(policy_retriever.policies_dir)
+    policy_path = policy_index.get(safe_name)
+    if policy_path is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Policy file {safe_name} not found")
 
-    return FileResponse(path=policy_path, media_type="text/plain", filename=safe_name)
+    try:
+        st = os.stat(policy_path)
+    except FileNotFoundError:
+        # Deleted since the index was built; drop the stale entry
+        policy_index.refresh()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Policy file {safe_name} not found"
+        ) from None
+    etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    cache_headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+        "Cache-Control": "public, max-age=300",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    suffix = Path(safe_name).suffix.lower()
+    media_type = _POLICY_MEDIA_TYPES.get(suffix) or mimetypes.guess_type(safe_name)[0] or "text/plain"
+    return FileResponse(
+        path=policy_path, media_type=media_type, filename=safe_name, headers=cache_headers, stat_result=st
+    )
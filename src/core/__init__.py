@@ -1,7 +1,7 @@
 """Core configuration, observability, and utilities."""
 
-from .config import Settings, get_settings
+from .config import Settings, SettingsSnapshot, get_settings
 from .observability import Observability
-from .openrouter_client import OpenRouterClient
+from .openrouter_client import OpenRouterClient, get_openrouter_client
 
-__all__ = ["Settings", "get_settings", "Observability", "OpenRouterClient"]
+__all__ = ["Settings", "SettingsSnapshot", "get_settings", "Observability", "OpenRouterClient", "get_openrouter_client"]
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from dataclasses import make_dataclass
+from functools import cache
 
+from dotenv import load_dotenv
+from pydantic import ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Read .env into os.environ once per process (existing variables win), so
+# Settings only has to look at the environment.
+load_dotenv(".env", override=False)
+
 
 class Settings(BaseSettings):
     """Application configuration loaded from environment variables."""
@@ -23,6 +30,9 @@ class Settings(BaseSettings):
     langfuse_public_key: str | None = None
     langfuse_secret_key: str | None = None
     langfuse_host: str | None = None
+    langfuse_sample_rate: float = 1.0  # Fraction of traces whose spans are sent (head sampling)
+    langfuse_tail_risk_threshold: float = 50.0  # Unsampled traces are kept if a risk_score exceeds this
+    langfuse_timeout: int = 20  # Seconds per Langfuse API request (LANGFUSE_TIMEOUT, as read by the SDK)
 
     # Memory Backend Configuration
     memory_backend: str = "local"  # Options: local (SQLite), databricks (Delta Lake)
@@ -83,18 +93,39 @@ class Settings(BaseSettings):
     environment: str = "development"
     log_level: str = "INFO"
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    model_config = SettingsConfigDict(extra="ignore")
+
+
+def _fallback_models(self) -> list[str]:
+    """Return list of fallback models (up to 3 fallbacks)."""
+    models = [self.fallback_model_1, self.fallback_model_2]
+    # Add fallback_model_3 if it is set (for backward compatibility)
+    if self.fallback_model_3:
+        models.append(self.fallback_model_3)
+    return models
+
+
+# Immutable copy of validated Settings, as returned by get_settings(). Generated
+# from Settings.model_fields so the two can't drift apart; plain slotted
+# attributes keep reads cheap for settings accessed on hot paths.
+SettingsSnapshot = make_dataclass(
+    "SettingsSnapshot",
+    [(name, field.annotation) for name, field in Settings.model_fields.items()],
+    namespace={"fallback_models": property(_fallback_models), "__module__": __name__},
+    frozen=True,
+    slots=True,
+)
+
 
-    @property
-    def fallback_models(self) -> list[str]:
-        """Return list of fallback models (up to 3 fallbacks)."""
-        models = [self.fallback_model_1, self.fallback_model_2]
-        # Add fallback_model_3 if it exists (for backward compatibility)
-        if hasattr(self, "fallback_model_3") and self.fallback_model_3:
-            models.append(self.fallback_model_3)
-        return models
+@cache
+def get_settings() -> SettingsSnapshot:
+    settings = Settings()  # type: ignore[call-arg]
+    return SettingsSnapshot(**settings.model_dump())
 
 
-@lru_cache(maxsize=1)
-def get_settings() -> Settings:
-    return Settings()  # type: ignore[call-arg]
+# Warm the cache at import so the first request doesn't pay for loading settings.
+# Invalid/missing configuration is not cached and still raises on the first real call.
+try:
+    get_settings()
+except ValidationError:
+    pass
@@ -1,26 +1,48 @@
 """Logging configuration for AFGA."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 from .config import get_settings
 
+_listener: QueueListener | None = None
+
 
 def setup_logging() -> None:
-    """Configure logging for the application."""
+    """Configure logging for the application.
+
+    Records are enqueued by a ``QueueHandler`` on the root logger and written
+    to stdout by a ``QueueListener`` thread, so log calls never block on I/O.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
     settings = get_settings()
 
     # Set log level from config
     log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
 
-    # Configure root logger
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-        ],
-    )
+    # Configure root logger, unless it is already configured (as basicConfig would skip it)
+    root_logger = logging.getLogger()
+    if not root_logger.handlers:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s", validate=False)
+        )
+
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+        # The QueueHandler keeps no formatter of its own, so records carry the plain
+        # message and the listener's handler applies the real format
+        root_logger.addHandler(QueueHandler(log_queue))
+        root_logger.setLevel(log_level)
 
     # Set specific log levels for noisy libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -1,15 +1,177 @@
 from __future__ import annotations
 
+import atexit
+import importlib.util
 import logging
+import queue
+import random
+import threading
 import uuid
+from collections import deque
 from contextlib import contextmanager
-from typing import Any, Dict, Generator, List, Optional
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+import httpx
 
 from .config import get_settings
 
 
 logger = logging.getLogger(__name__)
 
+# Background submission of spans/generations to Langfuse
+_QUEUE_MAXSIZE = 10_000
+_DRAIN_BATCH_SIZE = 50
+_DRAIN_POLL_SECONDS = 1.0
+
+# Spans buffered per unsampled trace, emitted only if the trace turns out interesting
+_TAIL_BUFFER_SIZE = 50
+
+# Resolved once per process; the Langfuse class itself is imported on first use
+_LANGFUSE_AVAILABLE = importlib.util.find_spec("langfuse") is not None
+_LANGFUSE_CLS: Any = None
+
+# HTTP/2 for Langfuse ingestion needs the optional `h2` package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _get_langfuse_class() -> Any:
+    """Import and cache the Langfuse client class."""
+    global _LANGFUSE_CLS
+    if _LANGFUSE_CLS is None:
+        from langfuse import Langfuse
+
+        _LANGFUSE_CLS = Langfuse
+    return _LANGFUSE_CLS
+
+
+def _as_dict(data: Any) -> Any:
+    """Dump pydantic models for the Langfuse SDK; other values pass through."""
+    return data.model_dump() if hasattr(data, "model_dump") else data
+
+
+@dataclass(slots=True)
+class _TraceState:
+    """Per-trace context: the Langfuse trace, its sampling decision and the tail buffer."""
+
+    trace: Any
+    sampled: bool
+    tail_buffer: deque[Tuple[str, Dict[str, Any]]] = field(default_factory=lambda: deque(maxlen=_TAIL_BUFFER_SIZE))
+    tail_keep: bool = False
+
+
+# Observations are submitted by one drain thread shared by every Observability in the process
+# (the API builds an orchestrator, and so an Observability, per request). Items are
+# (client, kind, trace, kwargs); None stops the thread.
+_drain_queue: queue.Queue[Optional[Tuple[Any, str, Any, Dict[str, Any]]]] = queue.Queue(maxsize=_QUEUE_MAXSIZE)
+_drain_thread: Optional[threading.Thread] = None
+_drain_lock = threading.Lock()
+
+
+def _start_drain() -> None:
+    global _drain_thread
+    with _drain_lock:
+        if _drain_thread is None:
+            _drain_thread = threading.Thread(target=_drain_loop, name="langfuse-drain", daemon=True)
+            _drain_thread.start()
+            atexit.register(_stop_drain)
+
+
+def _stop_drain() -> None:
+    """Submit everything still queued, then stop the drain thread."""
+    global _drain_thread
+    with _drain_lock:
+        thread, _drain_thread = _drain_thread, None
+    if thread is not None:
+        _drain_queue.put(None)
+        thread.join()
+
+
+def _drain_loop() -> None:
+    """Submit queued observations in batches, flushing each client once per batch."""
+    stop = False
+    while not stop:
+        batch = [_drain_queue.get()]
+        while len(batch) < _DRAIN_BATCH_SIZE:
+            try:
+                batch.append(_drain_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        clients: Dict[int, Any] = {}
+        for item in batch:
+            if item is None:
+                stop = True
+                continue
+            client, kind, trace, kwargs = item
+            clients[id(client)] = client
+            if kind == "end":
+                _end_trace(trace, **kwargs)
+                continue
+            try:
+                observation = trace.generation(**kwargs) if kind == "generation" else trace.span(**kwargs)
+                observation.end()
+            except Exception as e:
+                logger.warning("Langfuse %s submission failed: %s", kind, e)
+        for client in clients.values():
+            try:
+                if hasattr(client, "flush"):
+                    client.flush()
+            except Exception as e:
+                logger.warning("Langfuse batch flush failed: %s", e)
+        for _ in batch:
+            _drain_queue.task_done()
+
+
+def _end_trace(trace: Any, **kwargs: Any) -> None:
+    try:
+        trace.update(**kwargs)
+        trace.end()
+    except Exception as e:
+        logger.warning("Langfuse trace end failed: %s", e)
+
+
+def _build_langfuse_http_client(timeout: float) -> httpx.Client:
+    """HTTP client for Langfuse that keeps connections alive between batch flushes."""
+    transport = httpx.HTTPTransport(
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+        retries=2,
+    )
+    return httpx.Client(transport=transport, timeout=timeout)
+
+
+@cache
+def _get_langfuse_client(public_key: str, secret_key: str, host: Optional[str], timeout: int) -> Any:
+    """Build the process-wide Langfuse client (and its HTTP client) once per configuration.
+
+    Returns:
+        The client, or None if the installed SDK lacks the ``trace()`` API
+    """
+    http_client = _build_langfuse_http_client(timeout)
+    try:
+        client = _get_langfuse_class()(
+            public_key=public_key,
+            secret_key=secret_key,
+            host=host,
+            # Passing our own client bypasses the SDK's timeout, so set it on both
+            httpx_client=http_client,
+            timeout=timeout,
+            flush_at=_DRAIN_BATCH_SIZE,
+            flush_interval=_DRAIN_POLL_SECONDS,
+        )
+    except Exception:
+        http_client.close()
+        raise
+    if not hasattr(client, "trace"):
+        if hasattr(client, "shutdown"):
+            client.shutdown()
+        http_client.close()
+        return None
+    return client
+
 
 class Observability:
     """Observability layer for tracing and logging with Langfuse.
@@ -19,6 +181,14 @@ class Observability:
     - Spans: Individual step tracking (risk assessment, policy check, memory update)
     - Generations: LLM call tracking with token usage and cost
 
+    Spans and generations are pushed onto a bounded, process-wide queue and
+    submitted to Langfuse in batches by a single daemon thread, keeping the SDK
+    off the request path.
+
+    Spans are head-sampled per trace (``langfuse_sample_rate``). Spans of an
+    unsampled trace are kept in a small ring buffer and still sent if the trace
+    fails or reports a risk score above ``langfuse_tail_risk_threshold``.
+
     Gracefully falls back to standard logging if Langfuse is not configured.
     """
 
@@ -26,28 +196,40 @@ class Observability:
         settings = get_settings()
         self.enabled = False
         self.client = None
-        self._current_trace = None  # Store current trace context
+        # Current trace of this request/task; a context variable so concurrent requests don't share it
+        self._trace_state: ContextVar[_TraceState | None] = ContextVar(f"langfuse_trace_{id(self)}", default=None)
+        self.sample_rate = settings.langfuse_sample_rate
+        self.tail_risk_threshold = settings.langfuse_tail_risk_threshold
 
         # Try to initialize Langfuse if credentials are provided
-        if settings.langfuse_public_key and settings.langfuse_secret_key:
+        if not (settings.langfuse_public_key and settings.langfuse_secret_key):
+            logger.info("Langfuse credentials not configured, using standard logging")
+        elif not _LANGFUSE_AVAILABLE:
+            logger.warning("Langfuse credentials configured but langfuse is not installed, using standard logging")
+        else:
             try:
-                from langfuse import Langfuse
-
-                self.client = Langfuse(
-                    public_key=settings.langfuse_public_key,
-                    secret_key=settings.langfuse_secret_key,
-                    host=settings.langfuse_host,
+                self.client = _get_langfuse_client(
+                    settings.langfuse_public_key,
+                    settings.langfuse_secret_key,
+                    settings.langfuse_host,
+                    settings.langfuse_timeout,
                 )
-                if hasattr(self.client, "trace"):
+                if self.client is not None:
                     self.enabled = True
+                    _start_drain()
                     logger.info("Langfuse observability enabled")
                 else:
                     logger.warning("Langfuse client missing trace() API; disabling observability integration")
-                    self.client = None
             except Exception as e:
-                logger.warning(f"Failed to initialize Langfuse, falling back to logging: {e}")
-        else:
-            logger.info("Langfuse credentials not configured, using standard logging")
+                logger.warning("Failed to initialize Langfuse, falling back to logging: %s", e)
+
+        if not self.enabled:
+            # Langfuse can't become enabled later: bind logging-only variants once so
+            # each call skips the enabled/client/trace checks.
+            self.trace = self._trace_disabled  # type: ignore[method-assign]
+            self.log_agent_step = self._log_agent_step_disabled  # type: ignore[method-assign]
+            self.log_llm_call = self._log_llm_call_disabled  # type: ignore[method-assign]
+            self.log_a2a_communication = self._log_a2a_communication_disabled  # type: ignore[method-assign]
 
     @contextmanager
     def trace(
@@ -73,53 +255,61 @@ class Observability:
                     input=metadata,
                     metadata={"trace_id": trace_id, "user_id": user_id} if user_id else {"trace_id": trace_id},
                 )
-                self._current_trace = trace  # Store trace context
-                logger.info(f"Langfuse trace started: {name} [{trace_id}]")
-                try:
-                    yield trace_id
-                    trace.update(output={"status": "completed"})
-                finally:
-                    try:
-                        trace.end()
-                        if hasattr(self.client, "flush"):
-                            self.client.flush()
-                    except Exception as flush_exc:
-                        logger.warning(f"Langfuse trace end failed: {flush_exc}")
-                    self._current_trace = None  # Clear trace context
             except Exception as e:
-                logger.warning(f"Langfuse trace failed: {e}")
+                logger.warning("Langfuse trace failed: %s", e)
                 yield trace_id
+                return
+
+            state = _TraceState(trace, sampled=self.sample_rate >= 1.0 or random.random() < self.sample_rate)
+            token = self._trace_state.set(state)
+            logger.info("Langfuse trace started: %s [%s]", name, trace_id)
+            status = "completed"
+            try:
+                yield trace_id
+            except Exception:
+                status = "error"
+                raise
+            finally:
+                self._trace_state.reset(token)
+                if not state.sampled and (state.tail_keep or status == "error"):
+                    logger.info(
+                        "Keeping %s buffered span(s) for unsampled trace [%s]", len(state.tail_buffer), trace_id
+                    )
+                    for kind, kwargs in state.tail_buffer:
+                        self._enqueue(kind, trace, **kwargs)
+                # Ended by the drain thread, after the spans queued before it have been sent
+                if not self._enqueue("end", trace, output={"status": status}):
+                    _end_trace(trace, output={"status": status})
         else:
-            logger.info(f"Trace {name} [{trace_id}]: {metadata}")
+            logger.info("Trace %s [%s]: %s", name, trace_id, metadata)
             yield trace_id
 
-    def log_agent_step(
-        self, trace_id: str, agent_name: str, step_name: str, input_data: Dict[str, Any], output_data: Dict[str, Any]
-    ) -> None:
+    def log_agent_step(self, trace_id: str, agent_name: str, step_name: str, input_data: Any, output_data: Any) -> None:
         """Log an agent step as a span.
 
         Args:
             trace_id: ID of the parent trace
             agent_name: Name of the agent (TAA, PAA, EMA)
             step_name: Name of the step (e.g., "assess_risk", "check_policy")
-            input_data: Input to the step
-            output_data: Output from the step
+            input_data: Input to the step (dict or pydantic model, dumped only when traced)
+            output_data: Output from the step (dict or pydantic model, dumped only when traced)
         """
-        if self.enabled and self.client and self._current_trace:
-            try:
-                span = self._current_trace.span(
-                    name=f"{agent_name}_{step_name}",
-                    input=input_data,
-                    output=output_data,
-                    metadata={"trace_id": trace_id, "agent": agent_name, "step": step_name},
-                )
-                span.end()
-                logger.info(f"Langfuse span logged [{trace_id}]: {agent_name}.{step_name}")
-            except Exception as e:
-                logger.warning(f"Langfuse log_agent_step failed: {e}")
-                logger.info(f"Agent step [{trace_id}]: {agent_name}.{step_name}")
+        state = self._trace_state.get()
+        if self.enabled and self.client and state:
+            queued = self._record(
+                state,
+                "span",
+                name=f"{agent_name}_{step_name}",
+                input=_as_dict(input_data),
+                output=_as_dict(output_data),
+                metadata={"trace_id": trace_id, "agent": agent_name, "step": step_name},
+            )
+            if queued:
+                logger.info("Langfuse span queued [%s]: %s.%s", trace_id, agent_name, step_name)
+            else:
+                logger.info("Agent step [%s]: %s.%s", trace_id, agent_name, step_name)
         else:
-            logger.info(f"Agent step [{trace_id}]: {agent_name}.{step_name}")
+            logger.info("Agent step [%s]: %s.%s", trace_id, agent_name, step_name)
 
     def log_llm_call(
         self,
@@ -142,75 +332,137 @@ class Observability:
             completion_tokens: Number of tokens in the completion
             model_parameters: Model configuration (temperature, max_tokens, etc.)
         """
+        state = self._trace_state.get()
+        if not (self.enabled and self.client and state):
+            logger.info("LLM call [%s]: model=%s", trace_id, model)
+            return
+
         model_parameters = model_parameters or {}
-        usage = None
 
-        # Prepare usage details if available
-        if prompt_tokens is not None and completion_tokens is not None:
-            usage = {
-                "input": prompt_tokens,
-                "output": completion_tokens,
-                "total": prompt_tokens + completion_tokens,
-            }
+        # Prepare usage details if any token counts were reported
+        input_tokens = prompt_tokens or 0
+        output_tokens = completion_tokens or 0
+        total_tokens = input_tokens + output_tokens
+        usage = {"input": input_tokens, "output": output_tokens, "total": total_tokens} if total_tokens else None
 
-        if self.enabled and self.client and self._current_trace:
-            try:
-                generation = self._current_trace.generation(
-                    name="llm_generation",
-                    model=model,
-                    input=prompt[:1000],  # Truncate for readability
-                    output=response,
-                    metadata={
-                        "trace_id": trace_id,
-                        "prompt_length": len(prompt),
-                        "response_length": len(response),
-                    },
-                    model_parameters=model_parameters,
-                    usage=usage,
-                )
-                generation.end()
-                logger.info(f"Langfuse generation logged [{trace_id}]: model={model}")
-            except Exception as e:
-                logger.warning(f"Langfuse log_llm_call failed: {e}")
-                logger.info(
-                    f"LLM call [{trace_id}]: model={model}, prompt_len={len(prompt)}, response_len={len(response)}"
-                )
+        prompt_length = len(prompt)
+        response_length = len(response)
+        queued = self._record(
+            state,
+            "generation",
+            name="llm_generation",
+            model=model,
+            input=prompt[:1000],  # Truncate for readability; response is passed as-is
+            output=response,
+            metadata={
+                "trace_id": trace_id,
+                "prompt_length": prompt_length,
+                "response_length": response_length,
+            },
+            model_parameters=model_parameters,
+            usage=usage,
+        )
+        if queued:
+            logger.info("Langfuse generation queued [%s]: model=%s", trace_id, model)
         else:
-            logger.info(f"LLM call [{trace_id}]: model={model}")
+            logger.info(
+                "LLM call [%s]: model=%s, prompt_len=%s, response_len=%s",
+                trace_id,
+                model,
+                prompt_length,
+                response_length,
+            )
 
-    def log_a2a_communication(self, trace_id: str, from_agent: str, to_agent: str, message: Dict[str, Any]) -> None:
+    def log_a2a_communication(self, trace_id: str, from_agent: str, to_agent: str, message: Any) -> None:
         """Log A2A inter-agent communication.
 
         Args:
             trace_id: ID of the parent trace
             from_agent: Source agent name
             to_agent: Destination agent name
-            message: Message content
+            message: Message content (dict or pydantic model, dumped only when traced)
         """
-        if self.enabled and self.client and self._current_trace:
-            try:
-                span = self._current_trace.span(
-                    name=f"a2a_{from_agent}_to_{to_agent}",
-                    input={"from": from_agent, "to": to_agent},
-                    output=message,
-                    metadata={"trace_id": trace_id, "communication_type": "A2A"},
-                )
-                span.end()
-                logger.info(f"Langfuse A2A logged [{trace_id}]: {from_agent} → {to_agent}")
-            except Exception as e:
-                logger.warning(f"Langfuse log_a2a_communication failed: {e}")
-                logger.info(f"A2A [{trace_id}]: {from_agent} → {to_agent}")
+        state = self._trace_state.get()
+        if self.enabled and self.client and state:
+            queued = self._record(
+                state,
+                "span",
+                name=f"a2a_{from_agent}_to_{to_agent}",
+                input={"from": from_agent, "to": to_agent},
+                output=_as_dict(message),
+                metadata={"trace_id": trace_id, "communication_type": "A2A"},
+            )
+            if queued:
+                logger.info("Langfuse A2A queued [%s]: %s → %s", trace_id, from_agent, to_agent)
+            else:
+                logger.info("A2A [%s]: %s → %s", trace_id, from_agent, to_agent)
         else:
-            logger.info(f"A2A [{trace_id}]: {from_agent} → {to_agent}")
+            logger.info("A2A [%s]: %s → %s", trace_id, from_agent, to_agent)
+
+    @contextmanager
+    def _trace_disabled(
+        self, name: str, metadata: Dict[str, Any] | None = None, user_id: Optional[str] = None
+    ) -> Generator[str, None, None]:
+        trace_id = str(uuid.uuid4())
+        logger.info("Trace %s [%s]: %s", name, trace_id, metadata or {})
+        yield trace_id
+
+    def _log_agent_step_disabled(
+        self, trace_id: str, agent_name: str, step_name: str, *args: Any, **kwargs: Any
+    ) -> None:
+        logger.info("Agent step [%s]: %s.%s", trace_id, agent_name, step_name)
+
+    def _log_llm_call_disabled(
+        self, trace_id: str, prompt: str, response: str, model: str, *args: Any, **kwargs: Any
+    ) -> None:
+        logger.info("LLM call [%s]: model=%s", trace_id, model)
+
+    def _log_a2a_communication_disabled(
+        self, trace_id: str, from_agent: str, to_agent: str, *args: Any, **kwargs: Any
+    ) -> None:
+        logger.info("A2A [%s]: %s → %s", trace_id, from_agent, to_agent)
+
+    def _record(self, state: _TraceState, kind: str, **kwargs: Any) -> bool:
+        """Queue an observation on the current trace, or buffer it if the trace is unsampled.
+
+        Returns:
+            False if the observation was neither queued nor buffered
+        """
+        if state.sampled:
+            return self._enqueue(kind, state.trace, **kwargs)
+
+        state.tail_buffer.append((kind, kwargs))
+        output = kwargs.get("output")
+        if isinstance(output, dict):
+            risk_score = output.get("risk_score")
+            if isinstance(risk_score, (int, float)) and risk_score > self.tail_risk_threshold:
+                state.tail_keep = True
+        return True
+
+    def _enqueue(self, kind: str, trace: Any, **kwargs: Any) -> bool:
+        """Queue a span/generation, or the end of a trace, for background submission.
+
+        Returns:
+            False if the queue is full and the observation was dropped
+        """
+        try:
+            _drain_queue.put_nowait((self.client, kind, trace, kwargs))
+            return True
+        except queue.Full:
+            logger.warning("Langfuse queue full, dropping %s %s", kind, kwargs.get("name"))
+            return False
 
     def flush(self) -> None:
         """Flush all pending events to Langfuse.
 
-        Call this before shutdown to ensure all events are sent.
+        Waits for every queued observation (of all instances) to be submitted,
+        then flushes the client. Call this before shutdown to ensure all events are sent.
         """
         if self.enabled and self.client:
             try:
+                if _drain_thread is not None:
+                    _drain_queue.join()
                 self.client.flush()
                 logger.info("Langfuse events flushed")
             except Exception as e:
-                logger.warning(f"Failed to flush Langfuse events: {e}")
+                logger.warning("Failed to flush Langfuse events: %s", e)
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-import json
 import logging
+from functools import cache
 from typing import Any, Dict, List
 
 import httpx
+import orjson
 
 from .config import get_settings
 
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses tied to the API key rather than the model (unauthorized, payment required, forbidden)
+_KEY_ERROR_STATUS_CODES = frozenset({401, 402, 403})
+
 
 class OpenRouterClient:
     """Simple wrapper around the OpenRouter API supporting retries and fallbacks."""
@@ -18,6 +22,13 @@ class OpenRouterClient:
     def __init__(self, timeout: float = 60.0) -> None:
         self.settings = get_settings()
         self.client = httpx.Client(timeout=timeout)
+        # Static per-client request data, built once instead of per call
+        self._headers = {
+            "Authorization": f"Bearer {self.settings.openrouter_api_key}",
+            "HTTP-Referer": "https://afga-demo",
+            "Content-Type": "application/json",
+        }
+        self._endpoint = f"{self.settings.openrouter_base_url}/chat/completions"
 
     def completion(
         self,
@@ -38,17 +49,28 @@ class OpenRouterClient:
             Generated text response
 
         Raises:
-            RuntimeError: If all models fail to generate a completion
+            RuntimeError: If all models fail to generate a completion, or the API key is rejected
         """
         models = [model or self.settings.primary_model, *self.settings.fallback_models]
         for model_id in models:
             try:
                 result = self._call_openrouter(prompt, model_id, context=context, temperature=temperature)
                 return result
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code in _KEY_ERROR_STATUS_CODES:
+                    # Auth/billing errors apply to the API key, so every fallback would fail the same way
+                    raise RuntimeError(f"OpenRouter rejected the API key (HTTP {e.response.status_code})") from e
+                self._log_fallback(model_id)
             except Exception:
-                logger.warning("OpenRouter model %s failed, trying next fallback", model_id, exc_info=True)
+                self._log_fallback(model_id)
         raise RuntimeError("All OpenRouter models failed to generate a completion")
 
+    @staticmethod
+    def _log_fallback(model_id: str) -> None:
+        logger.warning("OpenRouter model %s failed, trying next fallback", model_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("OpenRouter model %s failure cause", model_id, exc_info=True)
+
     def _call_openrouter(
         self,
         prompt: str,
@@ -57,13 +79,8 @@ class OpenRouterClient:
         temperature: float = 0.3,
     ) -> str:
         """Call OpenRouter API with specified model."""
-        headers = {
-            "Authorization": f"Bearer {self.settings.openrouter_api_key}",
-            "HTTP-Referer": "https://afga-demo",
-            "Content-Type": "application/json",
-        }
-
-        messages = context + [{"role": "user", "content": prompt}] if context else [{"role": "user", "content": prompt}]
+        user_message = {"role": "user", "content": prompt}
+        messages = [*context, user_message] if context else [user_message]
 
         payload: Dict[str, Any] = {
             "model": model,
@@ -71,16 +88,14 @@ class OpenRouterClient:
             "temperature": temperature,
         }
 
-        response = self.client.post(
-            f"{self.settings.openrouter_base_url}/chat/completions", headers=headers, content=json.dumps(payload)
-        )
+        response = self.client.post(self._endpoint, headers=self._headers, content=orjson.dumps(payload))
 
         # Log response for debugging
         if response.status_code != 200:
             logger.error(f"OpenRouter error {response.status_code}: {response.text}")
 
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         choices = data.get("choices", [])
         if not choices:
             raise ValueError("No choices returned from OpenRouter API")
@@ -90,3 +105,16 @@ class OpenRouterClient:
     def close(self) -> None:
         """Close the HTTP client."""
         self.client.close()
+
+
+@cache
+def get_openrouter_client() -> OpenRouterClient:
+    """Return the process-wide OpenRouter client, sharing one HTTP connection pool."""
+    return OpenRouterClient()
+
+
+def close_openrouter_client() -> None:
+    """Close the shared client if it was created (call on application shutdown)."""
+    if get_openrouter_client.cache_info().currsize:
+        get_openrouter_client().close()
+        get_openrouter_client.cache_clear()
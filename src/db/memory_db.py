@@ -2,157 +2,620 @@
 
 from __future__ import annotations
 
-import json
+import atexit
+import itertools
 import logging
+import os
+import queue
+import secrets
 import sqlite3
-import uuid
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Any
+
+import orjson
+import zstandard
 
 from ..models.memory_schemas import MemoryQuery, MemoryStats, CRSCalculation
 from ..models.schemas import MemoryException, KPIMetrics, TransactionResult
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 logger = logging.getLogger(__name__)
 
+# Applied to every connection (these pragmas are per-connection in SQLite)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+    # Bounds the ANALYZE that PRAGMA optimize runs, so it stays cheap on large tables
+    "PRAGMA analysis_limit=1000",
+    # Checkpoint inline only once the WAL reaches ~40 MB; batch paths call checkpoint() instead
+    "PRAGMA wal_autocheckpoint=10000",
+)
+
+_CHECKPOINT_MODES = frozenset({"PASSIVE", "FULL", "RESTART", "TRUNCATE"})
+
+# Stored descriptions that _normalize_description replaces with a readable one (compared stripped, lowercased)
+_PLACEHOLDER_DESCRIPTIONS = frozenset({"", "n/a", "na", "none"})
+
+# Per-connection prepared-statement cache; sized so every fixed statement plus each
+# filter combination of iter_exceptions stays compiled on a long-lived connection
+_CACHED_STATEMENTS = 256
+
+# Refresh query-planner statistics (PRAGMA optimize) after this many write transactions
+_OPTIMIZE_EVERY_WRITES = 1000
+
+
+@lru_cache(maxsize=256)
+def _rule_label(rule_type: str) -> str:
+    """Readable label for a rule type, e.g. ``'vendor_exception'`` -> ``'Vendor Exception'``."""
+    return rule_type.replace("_", " ").title()
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize to a JSON string for TEXT columns."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# query_exceptions result cache
+_QUERY_CACHE_SIZE = 256
+_QUERY_CACHE_TTL_SECONDS = 30.0
+
+# Adaptive memory version per database file, bumped on every rule write. It is part of the
+# query cache key, so a write through any MemoryDatabase instance on the same file (e.g. the
+# EMA's own instance) invalidates every instance's cached results. The TTL bounds staleness
+# from writes made by other processes.
+_memory_versions: Dict[str, int] = {}
+_version_counter = itertools.count(1)
+
+# Live instances, so pooled connections are closed (and optimized) at interpreter exit
+_open_databases: weakref.WeakSet[MemoryDatabase] = weakref.WeakSet()
+
+
+def _close_open_databases() -> None:
+    for db in list(_open_databases):
+        try:
+            db.close()
+        except sqlite3.Error as exc:
+            logger.debug("Failed to close memory database %s: %s", db.db_path, exc)
+
+
+atexit.register(_close_open_databases)
+
+# zstd level for the invoice_data column; level 3 keeps compression cheap on the write path
+_INVOICE_ZSTD_LEVEL = 3
+
+
+def decode_invoice_data(value: str | bytes | None) -> Optional[str]:
+    """Return the invoice JSON text of a ``transactions.invoice_data`` value.
+
+    New rows store zstd-compressed JSON (BLOB); rows written before that are plain TEXT.
+    """
+    if isinstance(value, bytes):
+        return zstandard.decompress(value).decode()
+    return value
+
+
+# Explicit datetime <-> TEXT conversion (the implicit defaults are deprecated since Python 3.12).
+# Timestamps keep the default "YYYY-MM-DD HH:MM:SS[.ffffff]" storage format. The converter only
+# runs for columns selected as ``col AS "col [timestamp]"`` (PARSE_COLNAMES), and fromisoformat
+# also accepts the "T"-separated values written by other tools.
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_converter("timestamp", lambda value: datetime.fromisoformat(value.decode()))
+
+# SQL expression for "now" in the same local-time text format Python's datetime adapter writes,
+# so timestamps stay comparable with DATE(...) filters and values bound from Python
+_SQL_NOW = "strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')"
+
+# Hot-path statements, kept as constants so reused connections hit sqlite3's statement cache
+_SQL_INSERT_TXN = """
+    INSERT INTO transactions
+    (transaction_id, invoice_id, invoice_data, risk_score, risk_level,
+     paa_decision, policy_check_json, final_decision, decision_reasoning, human_override, processing_time_ms,
+     audit_trail, has_audit, trace_id, created_at, updated_at, source_document_path)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_EXC = f"""
+    INSERT INTO adaptive_memory
+    (exception_id, vendor, category, rule_type, description, condition, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, {_SQL_NOW})
+"""
+
+_SQL_INSERT_PENDING = """
+    INSERT INTO pending_transactions
+    (pending_id, invoice_data, trace_id, status, created_at, updated_at)
+    VALUES (?, ?, ?, 'pending', ?, ?)
+"""
+
+# Everything _transaction_params reads from a TransactionResult, fetched in one C-level call
+_TXN_ATTRS = attrgetter(
+    "transaction_id",
+    "invoice",
+    "risk_assessment.risk_score",
+    "risk_assessment.risk_level",
+    "policy_check",
+    "final_decision",
+    "decision_reasoning",
+    "human_override",
+    "processing_time_ms",
+    "audit_trail",
+    "trace_id",
+    "created_at",
+    "source_document_path",
+)
+
+# Columns that may be requested from the transactions table; projections are checked against
+# this set before being interpolated into SQL
+_TRANSACTION_COLUMNS = frozenset(
+    {
+        "transaction_id",
+        "invoice_id",
+        "invoice_data",
+        "risk_score",
+        "risk_level",
+        "paa_decision",
+        "policy_check_json",
+        "final_decision",
+        "decision_reasoning",
+        "human_override",
+        "processing_time_ms",
+        "audit_trail",
+        "has_audit",
+        "trace_id",
+        "created_at",
+        "updated_at",
+        "source_document_path",
+    }
+)
+
+# Metadata-only projection for transaction listings (no invoice, policy or audit-trail blobs)
+TRANSACTION_SUMMARY_COLUMNS = (
+    "transaction_id",
+    "invoice_id",
+    "risk_score",
+    "risk_level",
+    "final_decision",
+    "human_override",
+    "processing_time_ms",
+    "created_at",
+)
+
+
+def _transaction_projection(columns: Optional[Sequence[str]]) -> str:
+    """Return the SELECT list for a transactions query (all columns if ``columns`` is None)."""
+    if columns is None:
+        return "*"
+    unknown = set(columns) - _TRANSACTION_COLUMNS
+    if unknown or not columns:
+        raise ValueError(f"Invalid transaction columns: {sorted(unknown) or 'none given'}")
+    return ", ".join(columns)
+
+
+# Columns added to existing tables after their first release, as (name, definition), in order.
+# has_audit is a stored flag for a non-empty audit trail, so KPI aggregates don't compare the
+# JSON text; it is backfilled when added.
+_ADDED_COLUMNS = {
+    "adaptive_memory": (
+        ("deleted_at", "TIMESTAMP"),
+        ("is_active", "INTEGER DEFAULT 1"),
+    ),
+    "transactions": (
+        ("source_document_path", "TEXT"),
+        ("decision_reasoning", "TEXT"),
+        ("updated_at", "TIMESTAMP"),
+        ("policy_check_json", "TEXT"),
+        ("has_audit", "INTEGER NOT NULL DEFAULT 0"),
+    ),
+}
+
+# KPI/CRS aggregates. The CRS success rate is weighted by applied_count.
+_SQL_TXN_KPIS = """
+    SELECT COUNT(*) AS total,
+           SUM(CASE WHEN human_override = 1 THEN 1 ELSE 0 END),
+           SUM(CASE WHEN final_decision = 'approved' AND human_override = 0 THEN 1 ELSE 0 END),
+           AVG(processing_time_ms),
+           SUM(has_audit)
+    FROM transactions
+"""
+
+_SQL_CRS_ALL = """
+    SELECT COUNT(*), SUM(applied_count * success_rate) / SUM(applied_count)
+    FROM adaptive_memory
+    WHERE applied_count > 0
+"""
+
+_SQL_CRS_DAY = _SQL_CRS_ALL + " AND DATE(last_applied_at) = ?"
+
+# One row: transaction KPIs followed by (CRS applications, CRS success rate) for the day, or
+# all-time if the day has no transactions. With LIMIT 1 SQLite stops after the first branch
+# that yields a row, so the all-time scan only runs on the fallback path.
+_SQL_KPI_AGGREGATES = f"""
+    SELECT * FROM ({_SQL_TXN_KPIS} WHERE DATE(created_at) = ?), ({_SQL_CRS_DAY}) WHERE total > 0
+    UNION ALL
+    SELECT * FROM ({_SQL_TXN_KPIS}), ({_SQL_CRS_ALL})
+    LIMIT 1
+"""
+
+# Placeholder-description rewrite, mirroring MemoryDatabase._normalize_description in one statement:
+# a text condition.reason wins, then a rule label (rule_label() is registered by the caller)
+_SQL_BACKFILL_DESCRIPTIONS = """
+    UPDATE adaptive_memory
+    SET description = CASE
+        WHEN json_valid(condition)
+             AND json_type(condition, '$.reason') = 'text'
+             AND TRIM(json_extract(condition, '$.reason'), char(32, 9, 10, 13)) <> ''
+            THEN TRIM(json_extract(condition, '$.reason'), char(32, 9, 10, 13))
+        WHEN vendor <> '' THEN rule_label(COALESCE(rule_type, 'Learned exception')) || ' – Vendor ' || vendor
+        WHEN rule_type <> '' THEN rule_label(rule_type)
+        ELSE 'Learned exception'
+    END
+    WHERE description IS NULL
+       OR TRIM(description) = ''
+       OR LOWER(description) IN ('n/a', 'na', 'none')
+"""
+
+# Per-day KPI upsert for every day in a range that has transactions (one pass over each table)
+_SQL_RECOMPUTE_KPIS = """
+    WITH txn AS (
+        SELECT DATE(created_at) AS day,
+               COUNT(*) AS total,
+               SUM(CASE WHEN human_override = 1 THEN 1 ELSE 0 END) AS corrections,
+               SUM(CASE WHEN final_decision = 'approved' AND human_override = 0 THEN 1 ELSE 0 END) AS auto_approved,
+               AVG(processing_time_ms) AS avg_time,
+               SUM(has_audit) AS with_audit
+        FROM transactions
+        WHERE DATE(created_at) BETWEEN :start AND :end
+        GROUP BY day
+    ),
+    mem AS (
+        SELECT DATE(last_applied_at) AS day,
+               SUM(applied_count * success_rate) / SUM(applied_count) AS avg_success
+        FROM adaptive_memory
+        WHERE applied_count > 0 AND DATE(last_applied_at) BETWEEN :start AND :end
+        GROUP BY day
+    )
+    INSERT INTO kpis
+    (date, total_transactions, human_corrections, hcr, crs, atar,
+     avg_processing_time_ms, audit_traceability_score)
+    SELECT txn.day,
+           txn.total,
+           txn.corrections,
+           txn.corrections * 100.0 / txn.total,
+           COALESCE(mem.avg_success, 0.0) * 100,
+           txn.auto_approved * 100.0 / txn.total,
+           COALESCE(CAST(txn.avg_time AS INTEGER), 0),
+           txn.with_audit * 100.0 / txn.total
+    FROM txn LEFT JOIN mem ON mem.day = txn.day
+    WHERE true
+    ON CONFLICT(date) DO UPDATE SET
+        total_transactions = excluded.total_transactions,
+        human_corrections = excluded.human_corrections,
+        hcr = excluded.hcr,
+        crs = excluded.crs,
+        atar = excluded.atar,
+        avg_processing_time_ms = excluded.avg_processing_time_ms,
+        audit_traceability_score = excluded.audit_traceability_score
+    RETURNING date, total_transactions, human_corrections, hcr, crs, atar,
+              avg_processing_time_ms, audit_traceability_score
+"""
+
+# Records one application, updating the moving average in SQL (right-hand sides see the pre-update row)
+_SQL_RECORD_EXC_USAGE = f"""
+    UPDATE adaptive_memory
+    SET applied_count = applied_count + 1,
+        success_rate = ((success_rate * applied_count) + ?) / (applied_count + 1),
+        last_applied_at = {_SQL_NOW}
+    WHERE exception_id = ?
+"""
+
+# executemany() takes no RETURNING, so only the single-row form appends it
+_SQL_UPDATE_EXC_USAGE = _SQL_RECORD_EXC_USAGE + "    RETURNING applied_count, success_rate\n"
+
 
 class MemoryDatabase:
     """SQLite database for adaptive memory and transaction storage."""
 
-    def __init__(self, db_path: str = "data/memory.db"):
+    def __init__(self, db_path: str = "data/memory.db", pool_size: int = 4):
         self.db_path = db_path
+        # Connections are reused across calls: one writer serialized by a lock,
+        # plus up to ``pool_size`` idle reader connections (opened on demand).
+        self._pool: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=pool_size)
+        self._writer_conn: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.Lock()
+        self._writes_since_optimize = 0
+        self._version_key = os.path.abspath(db_path)
+        self._query_cache: OrderedDict[tuple, tuple[float, List[MemoryException]]] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
         self._ensure_database()
+        # A single UPDATE of the description column, which no index covers, so running it
+        # after the indexes exist costs no index maintenance
         self._backfill_missing_descriptions()
+        # Gather planner statistics for any table that has none yet (0x10002 also considers
+        # tables the writer hasn't queried), so the first queries don't plan blind
+        with self._write_conn() as conn:
+            conn.execute("PRAGMA optimize=0x10002")
+        _open_databases.add(self)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the per-connection pragmas applied."""
+        # Pooled connections are handed between threads, but only ever used by one at a time
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            detect_types=sqlite3.PARSE_COLNAMES,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _conn(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a reader connection from the pool for SELECTs."""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.row_factory = None
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    @contextmanager
+    def _write_conn(self) -> Iterator[sqlite3.Connection]:
+        """Hold the shared writer connection; commits on success, rolls back on error."""
+        with self._writer_lock:
+            if self._writer_conn is None:
+                self._writer_conn = self._connect()
+            conn = self._writer_conn
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.row_factory = None
+
+            # The writer lives for the whole process, so refresh planner stats periodically
+            self._writes_since_optimize += 1
+            if self._writes_since_optimize >= _OPTIMIZE_EVERY_WRITES:
+                self._writes_since_optimize = 0
+                conn.execute("PRAGMA optimize")
+
+    @contextmanager
+    def _write_txn(self) -> Iterator[sqlite3.Connection]:
+        """Like :meth:`_write_conn`, inside an explicit ``BEGIN IMMEDIATE`` transaction.
+
+        Taking SQLite's write lock up front means a read-then-write sequence never has to
+        upgrade a shared lock (and hit SQLITE_BUSY) when another process is writing.
+        """
+        with self._write_conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+
+    def _invalidate_query_cache(self) -> None:
+        """Mark cached query_exceptions results for this database file as stale."""
+        _memory_versions[self._version_key] = next(_version_counter)
+
+    def checkpoint(self, mode: str = "PASSIVE") -> tuple[int, int, int]:
+        """Copy committed WAL frames back into the database file.
+
+        Automatic checkpoints are deferred (see ``wal_autocheckpoint``), so callers that finish a
+        batch of writes, or a scheduled task, should call this to keep that work off the commit
+        path. A PASSIVE checkpoint runs on a reader connection and never blocks writers.
+
+        Args:
+            mode: SQLite checkpoint mode (PASSIVE, FULL, RESTART or TRUNCATE)
+
+        Returns:
+            (busy, WAL frames, frames checkpointed), as reported by ``PRAGMA wal_checkpoint``
+        """
+        mode = mode.upper()
+        if mode not in _CHECKPOINT_MODES:
+            raise ValueError(f"Invalid checkpoint mode: {mode}")
+        with self._conn() as conn:
+            busy, log_frames, checkpointed = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        return busy, log_frames, checkpointed
+
+    def close(self) -> None:
+        """Close the writer and all idle pooled connections."""
+        with self._writer_lock:
+            if self._writer_conn is not None:
+                self._writer_conn.execute("PRAGMA optimize")
+                self._writer_conn.close()
+                self._writer_conn = None
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
 
     def _ensure_database(self) -> None:
         """Create database and tables if they don't exist."""
         # Ensure data directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Create adaptive_memory table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS adaptive_memory (
-                exception_id TEXT PRIMARY KEY,
-                vendor TEXT,
-                category TEXT,
-                rule_type TEXT,
-                description TEXT,
-                condition TEXT,
-                applied_count INTEGER DEFAULT 0,
-                success_rate REAL DEFAULT 1.0,
-                created_at TIMESTAMP,
-                last_applied_at TIMESTAMP,
-                deleted_at TIMESTAMP,
-                is_active INTEGER DEFAULT 1
-            )
-        """)
+        with self._write_conn() as conn:
+            # WAL lets readers run alongside a writer; the mode is persisted in the database file.
+            # The journal mode can't be changed inside a transaction, so this runs on its own.
+            conn.execute("PRAGMA journal_mode=WAL")
+            self.pragmas = {
+                name: conn.execute(f"PRAGMA {name}").fetchone()[0]
+                for name in (
+                    "journal_mode",
+                    "synchronous",
+                    "temp_store",
+                    "cache_size",
+                    "mmap_size",
+                    "busy_timeout",
+                    "wal_autocheckpoint",
+                )
+            }
 
-        # Add deleted_at and is_active columns if they don't exist (for existing databases)
-        try:
-            cursor.execute("ALTER TABLE adaptive_memory ADD COLUMN deleted_at TIMESTAMP")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+        # All schema changes run in one transaction: a crash mid-migration leaves the previous
+        # schema intact, and concurrent constructors serialize on the write lock
+        with self._write_txn() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute("ALTER TABLE adaptive_memory ADD COLUMN is_active INTEGER DEFAULT 1")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+            # Create adaptive_memory table. Rows live in the exception_id B-tree itself, so
+            # lookups by id skip the separate primary-key index a rowid table would need.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS adaptive_memory (
+                    exception_id TEXT PRIMARY KEY,
+                    vendor TEXT,
+                    category TEXT,
+                    rule_type TEXT,
+                    description TEXT,
+                    condition TEXT,
+                    applied_count INTEGER DEFAULT 0,
+                    success_rate REAL DEFAULT 1.0,
+                    created_at TIMESTAMP,
+                    last_applied_at TIMESTAMP,
+                    deleted_at TIMESTAMP,
+                    is_active INTEGER DEFAULT 1
+                ) WITHOUT ROWID
+            """)
 
-        try:
-            cursor.execute("ALTER TABLE transactions ADD COLUMN source_document_path TEXT")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-
-        # Create transactions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS transactions (
-                transaction_id TEXT PRIMARY KEY,
-                invoice_id TEXT,
-                invoice_data TEXT,
-                risk_score REAL,
-                risk_level TEXT,
-                paa_decision TEXT,
-                policy_check_json TEXT,
-                final_decision TEXT,
-                decision_reasoning TEXT,
-                human_override INTEGER,
-                processing_time_ms INTEGER,
-                audit_trail TEXT,
-                trace_id TEXT,
-                created_at TIMESTAMP,
-                updated_at TIMESTAMP,
-                source_document_path TEXT
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS pending_transactions (
-                pending_id TEXT PRIMARY KEY,
-                invoice_data TEXT NOT NULL,
-                trace_id TEXT,
-                status TEXT NOT NULL DEFAULT 'pending',
-                error_message TEXT,
-                transaction_id TEXT,
-                created_at TIMESTAMP,
-                updated_at TIMESTAMP
-            )
-        """)
+            # Create transactions table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS transactions (
+                    transaction_id TEXT PRIMARY KEY,
+                    invoice_id TEXT,
+                    invoice_data TEXT,
+                    risk_score REAL,
+                    risk_level TEXT,
+                    paa_decision TEXT,
+                    policy_check_json TEXT,
+                    final_decision TEXT,
+                    decision_reasoning TEXT,
+                    human_override INTEGER,
+                    processing_time_ms INTEGER,
+                    audit_trail TEXT,
+                    has_audit INTEGER NOT NULL DEFAULT 0,
+                    trace_id TEXT,
+                    created_at TIMESTAMP,
+                    updated_at TIMESTAMP,
+                    source_document_path TEXT
+                )
+            """)
 
-        # Add columns if they don't exist (for existing databases)
-        try:
-            cursor.execute("ALTER TABLE transactions ADD COLUMN decision_reasoning TEXT")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS pending_transactions (
+                    pending_id TEXT PRIMARY KEY,
+                    invoice_data TEXT NOT NULL,
+                    trace_id TEXT,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    error_message TEXT,
+                    transaction_id TEXT,
+                    created_at TIMESTAMP,
+                    updated_at TIMESTAMP
+                )
+            """)
 
-        try:
-            cursor.execute("ALTER TABLE transactions ADD COLUMN updated_at TIMESTAMP")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+            # Serves the FIFO fetch (WHERE status = 'pending' ORDER BY created_at LIMIT) without a
+            # sort, and the pending count; it supersedes the status-only index
+            cursor.execute("DROP INDEX IF EXISTS idx_pending_status")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_pending_status_created
+                ON pending_transactions(status, created_at)
+            """)
 
-        try:
-            cursor.execute("ALTER TABLE transactions ADD COLUMN policy_check_json TEXT")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_pending_status
-            ON pending_transactions(status)
-        """)
-
-        # Create kpis table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS kpis (
-                date TEXT PRIMARY KEY,
-                total_transactions INTEGER,
-                human_corrections INTEGER,
-                hcr REAL,
-                crs REAL,
-                atar REAL,
-                avg_processing_time_ms INTEGER,
-                audit_traceability_score REAL
-            )
-        """)
-
-        # Create indices for common queries
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_memory_vendor 
-            ON adaptive_memory(vendor)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_memory_category 
-            ON adaptive_memory(category)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_transactions_date 
-            ON transactions(created_at)
-        """)
-
-        conn.commit()
-        conn.close()
+            # Create kpis table. Rows are clustered on the date key, so date-range reads are a
+            # single B-tree range scan with no per-row lookup.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS kpis (
+                    date TEXT PRIMARY KEY,
+                    total_transactions INTEGER,
+                    human_corrections INTEGER,
+                    hcr REAL,
+                    crs REAL,
+                    atar REAL,
+                    avg_processing_time_ms INTEGER,
+                    audit_traceability_score REAL
+                ) WITHOUT ROWID
+            """)
+
+            # Add columns introduced after a table's first release, for existing databases.
+            # Only columns the table actually lacks are altered, so an up-to-date schema costs
+            # one table_info read per table rather than a failing ALTER per column.
+            for table, added_columns in _ADDED_COLUMNS.items():
+                existing = {name for (name,) in cursor.execute("SELECT name FROM pragma_table_info(?)", (table,))}
+                for column, definition in added_columns:
+                    if column in existing:
+                        continue
+                    cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                    if (table, column) == ("transactions", "has_audit"):
+                        cursor.execute(
+                            "UPDATE transactions SET has_audit = 1 "
+                            "WHERE audit_trail IS NOT NULL AND audit_trail != '[]'"
+                        )
+
+            # Create indices for common queries
+            # Vendor/category lookups (the per-invoice rule match) read active rules already in
+            # query_exceptions order
+            cursor.execute("DROP INDEX IF EXISTS idx_memory_vendor")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_memory_vendor_applied
+                ON adaptive_memory(vendor, applied_count DESC, created_at DESC, exception_id DESC)
+                WHERE is_active = 1
+            """)
+            cursor.execute("DROP INDEX IF EXISTS idx_memory_category")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_memory_category_applied
+                ON adaptive_memory(category, applied_count DESC, created_at DESC, exception_id DESC)
+                WHERE is_active = 1
+            """)
+            # Serves the "most applied rules" ORDER BY ... LIMIT and unfiltered query_exceptions
+            # pages (whose order ends with exception_id) without a sort
+            cursor.execute("DROP INDEX IF EXISTS idx_memory_applied")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_memory_active_sort
+                ON adaptive_memory(applied_count DESC, created_at DESC, exception_id DESC)
+                WHERE is_active = 1
+            """)
+            # Serves the "recent additions" ORDER BY created_at DESC LIMIT without a sort
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_memory_recent
+                ON adaptive_memory(created_at DESC)
+                WHERE is_active = 1
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_transactions_date 
+                ON transactions(created_at)
+            """)
+            # Expression indices for the per-day KPI/CRS filters (WHERE DATE(...) = ?), covering
+            # the aggregated columns so the day's KPIs are read from the index alone
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_transactions_day
+                ON transactions(
+                    DATE(created_at), human_override, final_decision, processing_time_ms, has_audit, created_at
+                )
+            """)
+            # Covers the CRS aggregates, so they are answered from the index alone; partial on
+            # their applied_count > 0 term, so never-applied rules are neither indexed nor scanned
+            cursor.execute("DROP INDEX IF EXISTS idx_memory_crs_day")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_memory_crs_applied
+                ON adaptive_memory(DATE(last_applied_at), applied_count, success_rate, last_applied_at)
+                WHERE applied_count > 0
+            """)
         logger.info(f"Memory database initialized at {self.db_path}")
 
     def _normalize_description(
@@ -164,51 +627,27 @@ class MemoryDatabase:
     ) -> str:
         """Ensure descriptions are human-readable instead of placeholders like 'N/A'."""
         text = (description or "").strip()
-        if text.lower() in {"", "n/a", "na", "none"}:
+        if text.lower() in _PLACEHOLDER_DESCRIPTIONS:
             reason = None
             if isinstance(condition, dict):
                 reason = condition.get("reason")
             if isinstance(reason, str) and reason.strip():
                 text = reason.strip()
             elif vendor:
-                rule_label = (rule_type or "Learned exception").replace("_", " ").title()
-                text = f"{rule_label} – Vendor {vendor}"
+                text = f"{_rule_label(rule_type or 'Learned exception')} – Vendor {vendor}"
             elif rule_type:
-                text = (rule_type or "Learned exception").replace("_", " ").title()
+                text = _rule_label(rule_type)
             else:
                 text = "Learned exception"
         return text
 
     def _backfill_missing_descriptions(self) -> None:
         """Update existing rows that still have placeholder descriptions."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT exception_id, vendor, rule_type, description, condition
-            FROM adaptive_memory
-            WHERE description IS NULL
-               OR TRIM(description) = ''
-               OR LOWER(description) IN ('n/a', 'na', 'none')
-        """
-        )
-        rows = cursor.fetchall()
-        updated = 0
-        for exception_id, vendor, rule_type, description, condition_json in rows:
-            try:
-                condition = json.loads(condition_json or "{}")
-            except json.JSONDecodeError:
-                condition = {}
-            normalized = self._normalize_description(description, vendor, condition, rule_type)
-            cursor.execute(
-                "UPDATE adaptive_memory SET description = ? WHERE exception_id = ?",
-                (normalized, exception_id),
-            )
-            updated += 1
-        if updated:
-            conn.commit()
-            logger.info(f"Backfilled descriptions for {updated} adaptive memory rule(s)")
-        conn.close()
+        with self._write_conn() as conn:
+            conn.create_function("rule_label", 1, _rule_label, deterministic=True)
+            updated = conn.execute(_SQL_BACKFILL_DESCRIPTIONS).rowcount
+            if updated:
+                logger.info(f"Backfilled descriptions for {updated} adaptive memory rule(s)")
 
     # ========== ADAPTIVE MEMORY OPERATIONS ==========
 
@@ -221,26 +660,58 @@ class MemoryDatabase:
         condition: Dict[str, Any],
     ) -> str:
         """Add a new exception to adaptive memory."""
-        exception_id = str(uuid.uuid4())[:8]
-        normalized_description = self._normalize_description(description, vendor, condition, rule_type)
-
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        rule = {
+            "vendor": vendor,
+            "category": category,
+            "rule_type": rule_type,
+            "description": description,
+            "condition": condition,
+        }
+        return self.add_exceptions_bulk([rule])[0]
+
+    def add_exceptions_bulk(self, rules: List[Dict[str, Any]]) -> List[str]:
+        """Add several exceptions to adaptive memory in a single transaction.
+
+        Args:
+            rules: Dicts with ``vendor``, ``category``, ``rule_type``, ``description`` and
+                ``condition`` keys (the arguments of :meth:`add_exception`)
 
-        cursor.execute(
-            """
-            INSERT INTO adaptive_memory 
-            (exception_id, vendor, category, rule_type, description, condition, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-            (exception_id, vendor, category, rule_type, normalized_description, json.dumps(condition), datetime.now()),
-        )
+        Returns:
+            The new exception IDs, in input order
+        """
+        if not rules:
+            return []
 
-        conn.commit()
-        conn.close()
+        # Normalize and serialize before taking the write lock
+        rows = [
+            (
+                rule.get("vendor"),
+                rule.get("category"),
+                rule.get("rule_type"),
+                self._normalize_description(
+                    rule.get("description"), rule.get("vendor"), rule.get("condition"), rule.get("rule_type")
+                ),
+                _json_dumps(rule.get("condition") or {}),
+            )
+            for rule in rules
+        ]
 
-        logger.info(f"Added exception {exception_id}: {normalized_description}")
-        return exception_id
+        # Short random ids can collide; on a clash the batch is rolled back and retried with new ids
+        while True:
+            exception_ids = [secrets.token_hex(4) for _ in rows]
+            try:
+                with self._write_txn() as conn:
+                    conn.executemany(
+                        _SQL_INSERT_EXC, ((exception_id, *row) for exception_id, row in zip(exception_ids, rows))
+                    )
+                break
+            except sqlite3.IntegrityError:
+                logger.debug("Exception id collision; retrying with new ids")
+        self._invalidate_query_cache()
+
+        for exception_id, row in zip(exception_ids, rows):
+            logger.info(f"Added exception {exception_id}: {row[3]}")
+        return exception_ids
 
     def delete_exception(self, exception_id: str) -> bool:
         """Soft-delete an exception from adaptive memory (mark as inactive).
@@ -248,67 +719,119 @@ class MemoryDatabase:
         Returns:
             True if exception was deleted, False if not found
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            UPDATE adaptive_memory 
-            SET is_active = 0, deleted_at = ?
-            WHERE exception_id = ? AND is_active = 1
-        """,
-            (datetime.now(), exception_id),
-        )
-        deleted = cursor.rowcount > 0
-
-        conn.commit()
-        conn.close()
-
-        if deleted:
-            logger.info(f"Soft-deleted exception {exception_id}")
-        else:
+        deleted = bool(self.delete_exceptions([exception_id]))
+        if not deleted:
             logger.warning(f"Exception {exception_id} not found or already deleted")
-
         return deleted
 
+    def delete_exceptions(self, exception_ids: Sequence[str]) -> List[str]:
+        """Soft-delete several exceptions with a single UPDATE.
+
+        Returns:
+            Ids of the exceptions that were deleted (unknown or already deleted ids are skipped)
+        """
+        return self._set_exceptions_active(exception_ids, active=False)
+
     def restore_exception(self, exception_id: str) -> bool:
         """Restore a soft-deleted exception.
 
         Returns:
             True if exception was restored, False if not found
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            UPDATE adaptive_memory 
-            SET is_active = 1, deleted_at = NULL
-            WHERE exception_id = ? AND is_active = 0
-        """,
-            (exception_id,),
-        )
-        restored = cursor.rowcount > 0
+        restored = bool(self.restore_exceptions([exception_id]))
+        if not restored:
+            logger.warning(f"Exception {exception_id} not found or already active")
+        return restored
 
-        conn.commit()
-        conn.close()
+    def restore_exceptions(self, exception_ids: Sequence[str]) -> List[str]:
+        """Restore several soft-deleted exceptions with a single UPDATE.
 
-        if restored:
-            logger.info(f"Restored exception {exception_id}")
-        else:
-            logger.warning(f"Exception {exception_id} not found or already active")
+        Returns:
+            Ids of the exceptions that were restored (unknown or already active ids are skipped)
+        """
+        return self._set_exceptions_active(exception_ids, active=True)
 
-        return restored
+    def _set_exceptions_active(self, exception_ids: Sequence[str], active: bool) -> List[str]:
+        if not exception_ids:
+            return []
+        # The ids are bound as one JSON array, so any number of them fits a single cached statement
+        deleted_at = "NULL" if active else _SQL_NOW
+        with self._write_conn() as conn:
+            changed = [
+                row[0]
+                for row in conn.execute(
+                    f"""
+                    UPDATE adaptive_memory
+                    SET is_active = ?, deleted_at = {deleted_at}
+                    WHERE exception_id IN (SELECT value FROM json_each(?)) AND is_active = ?
+                    RETURNING exception_id
+                """,
+                    (1 if active else 0, _json_dumps(list(exception_ids)), 0 if active else 1),
+                )
+            ]
+        if changed:
+            self._invalidate_query_cache()
+            logger.info(f"{'Restored' if active else 'Soft-deleted'} exception(s): {', '.join(changed)}")
+        return changed
+
+    def get_deleted_exceptions(self) -> List[Dict[str, Any]]:
+        """Get soft-deleted exceptions as row dicts (condition decoded), most recently deleted first."""
+        with self._conn() as conn:
+            cursor = conn.execute("SELECT * FROM adaptive_memory WHERE is_active = 0 ORDER BY deleted_at DESC")
+            columns = [column[0] for column in cursor.description]
+            exceptions = [dict(zip(columns, row)) for row in cursor]
+
+        for exception in exceptions:
+            try:
+                exception["condition"] = orjson.loads(exception.get("condition") or "{}")
+            except orjson.JSONDecodeError:
+                exception["condition"] = {}
+        return exceptions
 
     def query_exceptions(self, query: MemoryQuery) -> List[MemoryException]:
-        """Query exceptions from adaptive memory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        """Query exceptions from adaptive memory.
 
-        # Build dynamic query - only show active exceptions by default
+        Results are cached per query for a short TTL and dropped whenever a rule changes.
+        Callers get deep copies, so mutating a returned exception never alters the cache.
+        """
+        key = (
+            _memory_versions.get(self._version_key, 0),
+            query.vendor,
+            query.category,
+            query.rule_type,
+            query.min_success_rate,
+            query.limit,
+            query.after_id,
+        )
+        now = time.monotonic()
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+            if cached and now - cached[0] < _QUERY_CACHE_TTL_SECONDS:
+                self._query_cache.move_to_end(key)
+                return [exception.model_copy(deep=True) for exception in cached[1]]
+
+        exceptions = list(self.iter_exceptions(query))
+
+        with self._query_cache_lock:
+            self._query_cache[key] = (now, exceptions)
+            self._query_cache.move_to_end(key)
+            if len(self._query_cache) > _QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        return [exception.model_copy(deep=True) for exception in exceptions]
+
+    def iter_exceptions(self, query: MemoryQuery) -> Iterator[MemoryException]:
+        """Yield matching exceptions as rows are read, without materializing the result set.
+
+        Results are ordered by (applied_count, created_at, exception_id) descending. Use
+        ``query.limit`` for the page size and ``query.after_id`` (the last id of the previous
+        page) to fetch the next page with an index-friendly keyset comparison.
+        """
+        # Build dynamic query - only show active exceptions by default. Clauses are appended in a
+        # fixed order, so each filter combination yields identical SQL text and reuses the
+        # connection's cached prepared statement (unlike "? IS NULL OR vendor = ?", which would
+        # keep the vendor/category indexes from being used)
         where_clauses = ["is_active = 1"]
-        params = []
+        params: List[Any] = []
 
         if query.vendor:
             where_clauses.append("vendor = ?")
@@ -326,166 +849,177 @@ class MemoryDatabase:
             where_clauses.append("success_rate >= ?")
             params.append(query.min_success_rate)
 
-        where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
-
-        cursor.execute(
-            f"""
-            SELECT * FROM adaptive_memory
-            WHERE {where_clause}
-            ORDER BY applied_count DESC, created_at DESC
-        """,
-            params,
-        )
+        if query.after_id:
+            where_clauses.append(
+                "(applied_count, created_at, exception_id) < "
+                "(SELECT applied_count, created_at, exception_id FROM adaptive_memory WHERE exception_id = ?)"
+            )
+            params.append(query.after_id)
+
+        where_clause = " AND ".join(where_clauses)
+        limit_clause = ""
+        if query.limit:
+            limit_clause = "LIMIT ?"
+            params.append(query.limit)
+
+        with self._conn() as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT exception_id, vendor, category, rule_type, description, condition,
+                       applied_count, success_rate,
+                       created_at AS "created_at [timestamp]",
+                       last_applied_at AS "last_applied_at [timestamp]"
+                FROM adaptive_memory
+                WHERE {where_clause}
+                ORDER BY applied_count DESC, created_at DESC, exception_id DESC
+                {limit_clause}
+            """,
+                params,
+            )
 
-        rows = cursor.fetchall()
-        conn.close()
-
-        exceptions = []
-        for row in rows:
-            condition = json.loads(row["condition"]) if row["condition"] else {}
-            exceptions.append(
-                MemoryException(
-                    exception_id=row["exception_id"],
-                    vendor=row["vendor"],
-                    category=row["category"],
-                    rule_type=row["rule_type"],
-                    description=self._normalize_description(
-                        row["description"], row["vendor"], condition, row["rule_type"]
-                    ),
+            # Per-row callables bound once, outside the loop
+            loads = orjson.loads
+            normalize_description = self._normalize_description
+            for (
+                exception_id,
+                vendor,
+                category,
+                rule_type,
+                description,
+                condition_json,
+                applied_count,
+                success_rate,
+                created_at,
+                last_applied_at,
+            ) in cursor:
+                condition = loads(condition_json) if condition_json else {}
+                yield MemoryException(
+                    exception_id=exception_id,
+                    vendor=vendor,
+                    category=category,
+                    rule_type=rule_type,
+                    description=normalize_description(description, vendor, condition, rule_type),
                     condition=condition,
-                    applied_count=row["applied_count"],
-                    success_rate=row["success_rate"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    last_applied_at=datetime.fromisoformat(row["last_applied_at"]) if row["last_applied_at"] else None,
+                    applied_count=applied_count,
+                    success_rate=success_rate,
+                    created_at=created_at,
+                    last_applied_at=last_applied_at,
                 )
-            )
-
-        return exceptions
 
     def update_exception_usage(self, exception_id: str, success: bool = True) -> None:
         """Update exception usage statistics."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # A single write statement: its implicit transaction takes the write lock immediately,
+        # so no explicit BEGIN IMMEDIATE is needed
+        with self._write_conn() as conn:
+            row = conn.execute(
+                _SQL_UPDATE_EXC_USAGE,
+                (1.0 if success else 0.0, exception_id),
+            ).fetchone()
 
-        # Get current stats
-        cursor.execute(
-            """
-            SELECT applied_count, success_rate FROM adaptive_memory
-            WHERE exception_id = ?
-        """,
-            (exception_id,),
-        )
-
-        row = cursor.fetchone()
         if not row:
             logger.warning(f"Exception {exception_id} not found")
-            conn.close()
             return
 
-        applied_count, success_rate = row
-        new_applied_count = applied_count + 1
-
-        # Calculate new success rate using moving average
-        new_success_rate = ((success_rate * applied_count) + (1.0 if success else 0.0)) / new_applied_count
+        self._invalidate_query_cache()
+        # Lazy %-formatting: this runs on every rule application, and INFO is often disabled
+        logger.info("Updated exception %s: applied=%d, success_rate=%.2f", exception_id, *row)
 
-        cursor.execute(
-            """
-            UPDATE adaptive_memory
-            SET applied_count = ?,
-                success_rate = ?,
-                last_applied_at = ?
-            WHERE exception_id = ?
-        """,
-            (new_applied_count, new_success_rate, datetime.now(), exception_id),
-        )
+    def update_exceptions_usage(self, exception_ids: Sequence[str], success: bool = True) -> int:
+        """Record one application of each exception (with the same outcome) in one write transaction.
 
-        conn.commit()
-        conn.close()
+        Returns:
+            Number of exceptions updated (unknown ids are skipped)
+        """
+        if not exception_ids:
+            return 0
+        outcome = 1.0 if success else 0.0
+        with self._write_txn() as conn:
+            updated = conn.executemany(
+                _SQL_RECORD_EXC_USAGE, [(outcome, exception_id) for exception_id in exception_ids]
+            ).rowcount
 
-        logger.info(
-            f"Updated exception {exception_id}: applied={new_applied_count}, success_rate={new_success_rate:.2f}"
-        )
+        if updated:
+            self._invalidate_query_cache()
+        logger.info("Updated usage of %d exception(s)", updated)
+        return updated
 
     def get_memory_stats(self) -> MemoryStats:
         """Get statistics about adaptive memory."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Total and active exceptions (only count active ones)
-        cursor.execute("SELECT COUNT(*) FROM adaptive_memory WHERE is_active = 1")
-        total_exceptions = cursor.fetchone()[0] or 0
+        with self._conn() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("SELECT COUNT(*) FROM adaptive_memory WHERE applied_count > 0 AND is_active = 1")
-        active_exceptions = cursor.fetchone()[0] or 0
-
-        # Total applications - ensure we get a number, not None (only active)
-        cursor.execute("SELECT COALESCE(SUM(applied_count), 0) FROM adaptive_memory WHERE is_active = 1")
-        total_applications = cursor.fetchone()[0] or 0
-
-        # Average success rate (only active)
-        cursor.execute("SELECT AVG(success_rate) FROM adaptive_memory WHERE applied_count > 0 AND is_active = 1")
-        avg_success_rate = cursor.fetchone()[0] or 0.0
-
-        # Most applied rules (only active)
-        cursor.execute(
-            """
-            SELECT exception_id, description, applied_count, success_rate
-            FROM adaptive_memory
-            WHERE applied_count > 0 AND is_active = 1
-            ORDER BY applied_count DESC, created_at DESC
-            LIMIT 5
-        """
-        )
-        most_applied = []
-        for row in cursor.fetchall():
+            # Totals, applications and average success rate in one pass (only active)
             cursor.execute(
-                "SELECT vendor, rule_type, condition FROM adaptive_memory WHERE exception_id = ?",
-                (row[0],),
-            )
-            vendor_row = cursor.fetchone()
-            if vendor_row:
-                vendor, rule_type, condition_json = vendor_row
-            else:
-                vendor = rule_type = None
-                condition_json = "{}"
-            try:
-                condition = json.loads(condition_json or "{}")
-            except json.JSONDecodeError:
-                condition = {}
-            most_applied.append(
-                {
-                    "exception_id": row[0],
-                    "description": self._normalize_description(row[1], vendor, condition, rule_type),
-                    "applied_count": row[2],
-                    "success_rate": row[3],
-                }
+                """
+                SELECT COUNT(*),
+                       COUNT(CASE WHEN applied_count > 0 THEN 1 END),
+                       COALESCE(SUM(applied_count), 0),
+                       AVG(CASE WHEN applied_count > 0 THEN success_rate END)
+                FROM adaptive_memory
+                WHERE is_active = 1
+            """
             )
+            row = cursor.fetchone()
+            total_exceptions = row[0] or 0
+            active_exceptions = row[1] or 0
+            total_applications = row[2] or 0
+            avg_success_rate = row[3] or 0.0
 
-        # Recent additions (only active)
-        cursor.execute(
+            # Most applied rules and recent additions (only active) in one round trip;
+            # the first column tells the two top-5 lists apart
+            cursor.execute(
+                """
+                SELECT * FROM (
+                    SELECT 0, exception_id, description, applied_count, success_rate, NULL,
+                           vendor, rule_type, condition
+                    FROM adaptive_memory
+                    WHERE applied_count > 0 AND is_active = 1
+                    ORDER BY applied_count DESC, created_at DESC
+                    LIMIT 5
+                )
+                UNION ALL
+                SELECT * FROM (
+                    SELECT 1, exception_id, description, NULL, NULL, created_at,
+                           vendor, rule_type, condition
+                    FROM adaptive_memory
+                    WHERE is_active = 1
+                    ORDER BY created_at DESC
+                    LIMIT 5
+                )
             """
-            SELECT exception_id, description, created_at, vendor, rule_type, condition
-            FROM adaptive_memory
-            WHERE is_active = 1
-            ORDER BY created_at DESC
-            LIMIT 5
-        """
-        )
-        recent_additions = []
-        for row in cursor.fetchall():
-            try:
-                condition = json.loads(row[5] or "{}")
-            except json.JSONDecodeError:
-                condition = {}
-            recent_additions.append(
-                {
-                    "exception_id": row[0],
-                    "description": self._normalize_description(row[1], row[3], condition, row[4]),
-                    "created_at": row[2],
-                }
             )
-
-        conn.close()
+            most_applied = []
+            recent_additions = []
+            for kind, exception_id, description, applied_count, success_rate, created_at, vendor, rule_type, cond in (
+                cursor
+            ):
+                # The condition is only consulted for placeholder descriptions, which the startup
+                # backfill rewrites, so it is rarely worth parsing
+                if (description or "").strip().lower() in _PLACEHOLDER_DESCRIPTIONS:
+                    try:
+                        condition = orjson.loads(cond or "{}")
+                    except orjson.JSONDecodeError:
+                        condition = {}
+                    description = self._normalize_description(description, vendor, condition, rule_type)
+                else:
+                    description = description.strip()
+                if kind == 0:
+                    most_applied.append(
+                        {
+                            "exception_id": exception_id,
+                            "description": description,
+                            "applied_count": applied_count,
+                            "success_rate": success_rate,
+                        }
+                    )
+                else:
+                    recent_additions.append(
+                        {
+                            "exception_id": exception_id,
+                            "description": description,
+                            "created_at": created_at,
+                        }
+                    )
 
         return MemoryStats(
             total_exceptions=total_exceptions,
@@ -503,84 +1037,61 @@ class MemoryDatabase:
         if not items:
             return []
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        now = datetime.now()
-        pending_ids: list[str] = []
-
-        for item in items:
-            invoice_payload = item.get("invoice")
-            trace_id = item.get("trace_id")
-            if not invoice_payload:
-                continue
-
-            pending_id = str(uuid.uuid4())[:12]
-            cursor.execute(
-                """
-                INSERT INTO pending_transactions (
-                    pending_id,
-                    invoice_data,
-                    trace_id,
-                    status,
-                    created_at,
-                    updated_at
-                )
-                VALUES (?, ?, ?, 'pending', ?, ?)
-                """,
-                (pending_id, json.dumps(invoice_payload), trace_id, now, now),
-            )
-            pending_ids.append(pending_id)
+        # Formatted once (as the datetime adapter would), so the batch binds plain strings
+        now = datetime.now().isoformat(" ")
+        rows = [
+            (secrets.token_hex(6), _json_dumps(item["invoice"]), item.get("trace_id"), now, now)
+            for item in items
+            if item.get("invoice")
+        ]
+        if not rows:
+            return []
+        pending_ids = [row[0] for row in rows]
 
-        conn.commit()
-        conn.close()
+        # One statement and one commit for the whole batch
+        with self._write_conn() as conn:
+            conn.executemany(_SQL_INSERT_PENDING, rows)
 
-        if pending_ids:
-            logger.info("Enqueued %s pending transaction(s)", len(pending_ids))
+        logger.info("Enqueued %s pending transaction(s)", len(pending_ids))
         return pending_ids
 
     def fetch_pending_transactions(self, limit: int = 25, mark_processing: bool = True) -> list[Dict[str, Any]]:
         """Fetch pending transactions and optionally mark them as processing."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT pending_id, invoice_data, trace_id
-            FROM pending_transactions
-            WHERE status = 'pending'
-            ORDER BY created_at ASC
-            LIMIT ?
-            """,
-            (limit,),
-        )
-        rows = cursor.fetchall()
-        pending_ids = [row["pending_id"] for row in rows]
-
-        if pending_ids and mark_processing:
-            now = datetime.now()
-            cursor.executemany(
-                """
-                UPDATE pending_transactions
-                SET status = 'processing', updated_at = ?
-                WHERE pending_id = ?
-                """,
-                [(now, pending_id) for pending_id in pending_ids],
-            )
-            conn.commit()
-
-        conn.close()
-
-        pending: list[Dict[str, Any]] = []
-        for row in rows:
-            pending.append(
-                {
-                    "pending_id": row["pending_id"],
-                    "invoice_data": row["invoice_data"],
-                    "trace_id": row["trace_id"],
-                }
-            )
-        return pending
+        if not mark_processing:
+            with self._conn() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT pending_id, invoice_data, trace_id
+                    FROM pending_transactions
+                    WHERE status = 'pending'
+                    ORDER BY created_at ASC
+                    LIMIT ?
+                    """,
+                    (limit,),
+                ).fetchall()
+        else:
+            # Claim and read the oldest pending rows in one statement, so two workers can't both
+            # select a row before either marks it
+            with self._write_conn() as conn:
+                rows = conn.execute(
+                    f"""
+                    UPDATE pending_transactions
+                    SET status = 'processing', updated_at = {_SQL_NOW}
+                    WHERE pending_id IN (
+                        SELECT pending_id
+                        FROM pending_transactions
+                        WHERE status = 'pending'
+                        ORDER BY created_at ASC
+                        LIMIT ?
+                    )
+                    RETURNING pending_id, invoice_data, trace_id, created_at
+                    """,
+                    (limit,),
+                ).fetchall()
+            # RETURNING order is unspecified; hand rows back oldest first
+            rows.sort(key=itemgetter(3))
+
+        return [{"pending_id": row[0], "invoice_data": row[1], "trace_id": row[2]} for row in rows]
 
     def update_pending_transaction(
         self,
@@ -591,157 +1102,235 @@ class MemoryDatabase:
         error_message: Optional[str] = None,
     ) -> None:
         """Update the final status of a pending transaction."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            UPDATE pending_transactions
-            SET status = ?,
-                transaction_id = ?,
-                error_message = ?,
-                updated_at = ?
-            WHERE pending_id = ?
-            """,
-            (status, transaction_id, error_message, datetime.now(), pending_id),
-        )
-        conn.commit()
-        conn.close()
+        with self._write_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""
+                UPDATE pending_transactions
+                SET status = ?,
+                    transaction_id = ?,
+                    error_message = ?,
+                    updated_at = {_SQL_NOW}
+                WHERE pending_id = ?
+                """,
+                (status, transaction_id, error_message, pending_id),
+            )
 
     def count_pending_transactions(self) -> int:
         """Return the number of transactions still pending execution."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM pending_transactions WHERE status = 'pending'")
-        result = cursor.fetchone()
-        conn.close()
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM pending_transactions WHERE status = 'pending'")
+            result = cursor.fetchone()
         return (result[0] or 0) if result else 0
 
+    @staticmethod
+    def _transaction_params(result: TransactionResult) -> tuple:
+        """Bind parameters for ``_SQL_INSERT_TXN``."""
+        (
+            transaction_id,
+            invoice,
+            risk_score,
+            risk_level,
+            policy_check,
+            final_decision,
+            decision_reasoning,
+            human_override,
+            processing_time_ms,
+            audit_trail,
+            trace_id,
+            created_at,
+            source_document_path,
+        ) = _TXN_ATTRS(result)
+        # Bound twice below; formatted once as the datetime adapter would
+        created_at = created_at.isoformat(" ")
+        return (
+            transaction_id,
+            invoice.invoice_id,
+            zstandard.compress(invoice.__pydantic_serializer__.to_json(invoice), _INVOICE_ZSTD_LEVEL),
+            risk_score,
+            risk_level.value,
+            "compliant" if policy_check.is_compliant else "non_compliant",
+            policy_check.__pydantic_serializer__.to_json(policy_check).decode(),
+            final_decision.value,
+            decision_reasoning,
+            1 if human_override else 0,
+            processing_time_ms,
+            _json_dumps(audit_trail),
+            1 if audit_trail else 0,
+            trace_id,
+            created_at,
+            created_at,  # updated_at initially same as created_at
+            source_document_path,
+        )
+
     def save_transaction(self, result: TransactionResult) -> None:
         """Save transaction result to database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._write_txn() as conn:
+            conn.execute(_SQL_INSERT_TXN, self._transaction_params(result))
 
-        cursor.execute(
-            """
-            INSERT INTO transactions
-            (transaction_id, invoice_id, invoice_data, risk_score, risk_level, 
-             paa_decision, policy_check_json, final_decision, decision_reasoning, human_override, processing_time_ms, 
-             audit_trail, trace_id, created_at, updated_at, source_document_path)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                result.transaction_id,
-                result.invoice.invoice_id,
-                result.invoice.model_dump_json(),
-                result.risk_assessment.risk_score,
-                result.risk_assessment.risk_level.value,
-                "compliant" if result.policy_check.is_compliant else "non_compliant",
-                result.policy_check.model_dump_json(),
-                result.final_decision.value,
-                result.decision_reasoning,
-                1 if result.human_override else 0,
-                result.processing_time_ms,
-                json.dumps(result.audit_trail),
-                result.trace_id,
-                result.created_at,
-                result.created_at,  # updated_at initially same as created_at
-                result.source_document_path,
-            ),
-        )
+        logger.info(f"Saved transaction {result.transaction_id}")
 
-        conn.commit()
-        conn.close()
+    def save_transactions_bulk(self, results: List[TransactionResult]) -> int:
+        """Save several transaction results in a single transaction.
 
-        logger.info(f"Saved transaction {result.transaction_id}")
+        Returns:
+            Number of transactions saved
+        """
+        if not results:
+            return 0
+
+        with self._write_txn() as conn:
+            conn.executemany(_SQL_INSERT_TXN, (self._transaction_params(result) for result in results))
+
+        logger.info(f"Saved {len(results)} transactions")
+        return len(results)
 
     def update_transaction_source(self, transaction_id: str, path: str) -> None:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            """UPDATE transactions SET source_document_path = ?, updated_at = ? WHERE transaction_id = ?""",
-            (path, datetime.now(), transaction_id),
-        )
-        conn.commit()
-        conn.close()
+        with self._write_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"UPDATE transactions SET source_document_path = ?, updated_at = {_SQL_NOW} WHERE transaction_id = ?",
+                (path, transaction_id),
+            )
 
         logger.info(f"Updated source document for transaction {transaction_id}")
 
-    def get_transaction(self, transaction_id: str) -> Optional[Dict[str, Any]]:
-        """Get transaction by ID."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+    @staticmethod
+    def _hydrate_transaction(transaction: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode the JSON columns of a transaction row dict in place."""
+        if "invoice_data" in transaction:
+            transaction["invoice_data"] = decode_invoice_data(transaction["invoice_data"])
+            transaction["invoice"] = orjson.loads(transaction["invoice_data"])
+        if "audit_trail" in transaction:
+            transaction["audit_trail"] = orjson.loads(transaction["audit_trail"])
+        if transaction.get("policy_check_json"):
+            transaction["policy_check"] = orjson.loads(transaction["policy_check_json"])
+            del transaction["policy_check_json"]
+        return transaction
+
+    def get_transaction(
+        self, transaction_id: str, columns: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get transaction by ID.
 
-        cursor.execute("SELECT * FROM transactions WHERE transaction_id = ?", (transaction_id,))
-        row = cursor.fetchone()
-        conn.close()
+        Args:
+            transaction_id: Transaction to fetch
+            columns: Columns to read (default: all). Leaving out ``invoice_data`` and
+                ``audit_trail`` skips reading and decoding those blobs.
+        """
+        with self._conn() as conn:
+            cursor = conn.execute(
+                f"SELECT {_transaction_projection(columns)} FROM transactions WHERE transaction_id = ?",
+                (transaction_id,),
+            )
+            row = cursor.fetchone()
+            columns = [column[0] for column in cursor.description]
 
         if not row:
             return None
 
-        transaction = dict(row)
-        if "invoice_data" in transaction:
-            transaction["invoice"] = json.loads(transaction["invoice_data"])
-        if "audit_trail" in transaction:
-            transaction["audit_trail"] = json.loads(transaction["audit_trail"])
-        if transaction.get("policy_check_json"):
-            transaction["policy_check"] = json.loads(transaction["policy_check_json"])
-            del transaction["policy_check_json"]
+        return self._hydrate_transaction(dict(zip(columns, row)))
 
-        return transaction
+    def get_recent_transactions(
+        self, limit: int = 10, columns: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get recent transactions.
 
-    def get_recent_transactions(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get recent transactions."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        Args:
+            limit: Maximum number of transactions
+            columns: Columns to read (default: all), as for :meth:`get_transaction`
+        """
+        columns, rows = self.get_recent_transactions_columnar(limit, columns)
+        hydrate = self._hydrate_transaction
+        return [hydrate(dict(zip(columns, row))) for row in rows]
+
+    def get_recent_transactions_columnar(
+        self, limit: int = 10, columns: Optional[Sequence[str]] = None, oldest_first: bool = False
+    ) -> tuple[List[str], List[tuple]]:
+        """Get recent transactions as raw rows plus one shared list of column names.
+
+        JSON columns are returned undecoded (see :func:`decode_invoice_data` for ``invoice_data``);
+        suited to ``pandas.DataFrame(rows, columns=columns)``.
+
+        Args:
+            limit: Maximum number of transactions
+            columns: Columns to read (default: all), as for :meth:`get_transaction`
+            oldest_first: Return the oldest transactions instead, in ascending ``created_at`` order
+        """
+        with self._conn() as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT {_transaction_projection(columns)} FROM transactions
+                ORDER BY created_at {"ASC" if oldest_first else "DESC"}
+                LIMIT ?
+            """,
+                (limit,),
+            )
+            columns = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
 
-        cursor.execute(
-            """
-            SELECT * FROM transactions
-            ORDER BY created_at DESC
-            LIMIT ?
-        """,
-            (limit,),
-        )
+        return columns, rows
 
-        rows = cursor.fetchall()
-        conn.close()
+    def get_transaction_stats(self) -> Dict[str, Any]:
+        """Get transaction counts by decision and risk level, plus the average processing time."""
+        with self._conn() as conn:
+            total, avg_time = conn.execute("SELECT COUNT(*), AVG(processing_time_ms) FROM transactions").fetchone()
+            by_decision = dict(
+                conn.execute("SELECT final_decision, COUNT(*) FROM transactions GROUP BY final_decision")
+            )
+            by_risk = dict(conn.execute("SELECT risk_level, COUNT(*) FROM transactions GROUP BY risk_level"))
 
-        transactions = []
-        for row in rows:
-            trans = dict(row)
-            if "invoice_data" in trans:
-                trans["invoice"] = json.loads(trans["invoice_data"])
-            if "audit_trail" in trans:
-                trans["audit_trail"] = json.loads(trans["audit_trail"])
-            if trans.get("policy_check_json"):
-                trans["policy_check"] = json.loads(trans["policy_check_json"])
-                del trans["policy_check_json"]
+        return {
+            "total_transactions": total,
+            "by_decision": by_decision,
+            "by_risk_level": by_risk,
+            "avg_processing_time_ms": int(avg_time or 0),
+        }
 
-            transactions.append(trans)
-        return transactions
+    def get_decision_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-decision transaction counts and averages in one pass.
+
+        Returns:
+            final_decision -> count, avg_risk_score, avg_processing_time_ms and pending_hitl
+            (HITL transactions without a human override yet)
+        """
+        with self._conn() as conn:
+            cursor = conn.execute(
+                """
+                SELECT final_decision, COUNT(*), AVG(risk_score), AVG(processing_time_ms),
+                       COUNT(CASE WHEN LOWER(final_decision) = 'hitl' AND human_override = 0 THEN 1 END)
+                FROM transactions
+                GROUP BY final_decision
+            """
+            )
+            return {
+                decision: {
+                    "count": count,
+                    "avg_risk_score": avg_risk_score,
+                    "avg_processing_time_ms": avg_processing_time_ms,
+                    "pending_hitl": pending_hitl,
+                }
+                for decision, count, avg_risk_score, avg_processing_time_ms, pending_hitl in cursor
+            }
 
     def update_transaction_after_hitl(self, transaction_id: str, human_decision: str, final_reasoning: str) -> None:
         """Update transaction record after HITL feedback."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._write_conn() as conn:
+            cursor = conn.cursor()
 
-        # Use datetime.now() to ensure same timezone as created_at
-        cursor.execute(
-            """
-            UPDATE transactions
-            SET human_override = 1,
-                final_decision = ?,
-                decision_reasoning = ?,
-                updated_at = ?
-            WHERE transaction_id = ?
-        """,
-            (human_decision, final_reasoning, datetime.now(), transaction_id),
-        )
-
-        conn.commit()
-        conn.close()
+            # Local time, to match the timezone of created_at
+            cursor.execute(
+                f"""
+                UPDATE transactions
+                SET human_override = 1,
+                    final_decision = ?,
+                    decision_reasoning = ?,
+                    updated_at = {_SQL_NOW}
+                WHERE transaction_id = ?
+            """,
+                (human_decision, final_reasoning, transaction_id),
+            )
 
         logger.info(f"Updated transaction {transaction_id} with HITL feedback")
 
@@ -756,69 +1345,37 @@ class MemoryDatabase:
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Transaction and CRS aggregates for the date, falling back to ALL transactions (and
+        # all-time CRS) in the same statement if the date has none. They are read from a WAL
+        # snapshot on a reader connection, so the scan doesn't hold the write lock.
+        with self._conn() as conn:
+            row = conn.execute(_SQL_KPI_AGGREGATES, (date, date)).fetchone()
 
-        # Get transactions for the date
-        cursor.execute(
-            """
-            SELECT COUNT(*) as total,
-                   SUM(CASE WHEN human_override = 1 THEN 1 ELSE 0 END) as human_corrections,
-                   SUM(CASE WHEN final_decision = 'approved' AND human_override = 0 THEN 1 ELSE 0 END) as auto_approved,
-                   AVG(processing_time_ms) as avg_time,
-                   SUM(CASE WHEN audit_trail IS NOT NULL AND audit_trail != '[]' THEN 1 ELSE 0 END) as with_audit
-            FROM transactions
-            WHERE DATE(created_at) = ?
-        """,
-            (date,),
-        )
-
-        row = cursor.fetchone()
         total_transactions = row[0] or 0
         human_corrections = row[1] or 0
         auto_approved = row[2] or 0
         avg_time = int(row[3]) if row[3] else 0
         with_audit = row[4] or 0
 
-        # If no transactions for this date, calculate across ALL transactions
-        if total_transactions == 0:
-            cursor.execute("""
-                SELECT COUNT(*) as total,
-                       SUM(CASE WHEN human_override = 1 THEN 1 ELSE 0 END) as human_corrections,
-                       SUM(CASE WHEN final_decision = 'approved' AND human_override = 0 THEN 1 ELSE 0 END) as auto_approved,
-                       AVG(processing_time_ms) as avg_time,
-                       SUM(CASE WHEN audit_trail IS NOT NULL AND audit_trail != '[]' THEN 1 ELSE 0 END) as with_audit
-                FROM transactions
-            """)
-            row = cursor.fetchone()
-            total_transactions = row[0] or 0
-            human_corrections = row[1] or 0
-            auto_approved = row[2] or 0
-            avg_time = int(row[3]) if row[3] else 0
-            with_audit = row[4] or 0
-
         # Calculate KPIs
         hcr = (human_corrections / total_transactions * 100) if total_transactions > 0 else 0
         atar = (auto_approved / total_transactions * 100) if total_transactions > 0 else 0
         audit_traceability = (with_audit / total_transactions * 100) if total_transactions > 0 else 0
 
-        # Calculate CRS (Context Retention Score) - use all time if no date-specific data
-        crs_calc = self.calculate_crs(date if total_transactions > 0 else None)
-        crs = crs_calc.crs_score
+        # CRS (Context Retention Score) - all time if no date-specific data
+        crs = self._build_crs(row[5], row[6]).crs_score
 
         # Save KPIs
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO kpis
-            (date, total_transactions, human_corrections, hcr, crs, atar, 
-             avg_processing_time_ms, audit_traceability_score)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (date, total_transactions, human_corrections, hcr, crs, atar, avg_time, audit_traceability),
-        )
-
-        conn.commit()
-        conn.close()
+        with self._write_conn() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO kpis
+                (date, total_transactions, human_corrections, hcr, crs, atar, 
+                 avg_processing_time_ms, audit_traceability_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (date, total_transactions, human_corrections, hcr, crs, atar, avg_time, audit_traceability),
+            )
 
         kpi_metrics = KPIMetrics(
             date=date,
@@ -834,109 +1391,100 @@ class MemoryDatabase:
         logger.info(f"Calculated KPIs for {date}: H-CR={hcr:.1f}%, CRS={crs:.1f}%, ATAR={atar:.1f}%")
         return kpi_metrics
 
-    def calculate_crs(self, date: Optional[str] = None) -> CRSCalculation:
-        """Calculate Context Retention Score.
+    def recompute_kpis(self, start_date: str, end_date: str) -> List[KPIMetrics]:
+        """Recalculate and save KPIs for every day in a range that has transactions.
 
-        If date is None, calculates across ALL exceptions (all-time).
-        """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        Equivalent to calling :meth:`calculate_and_save_kpis` for each of those days, but done
+        with one grouped aggregate and one upsert (e.g. to backfill after downtime). Days
+        without transactions are skipped rather than given all-time figures.
 
-        if date:
-            # Get exceptions applied on this date
-            cursor.execute(
-                """
-                SELECT COUNT(*) FROM adaptive_memory
-                WHERE DATE(last_applied_at) = ? AND applied_count > 0
-            """,
-                (date,),
-            )
+        Args:
+            start_date: First day (YYYY-MM-DD), inclusive
+            end_date: Last day (YYYY-MM-DD), inclusive
 
-            applications_today = cursor.fetchone()[0] or 0
+        Returns:
+            The saved KPIs, most recent first
+        """
+        with self._write_txn() as conn:
+            cursor = conn.execute(_SQL_RECOMPUTE_KPIS, {"start": start_date, "end": end_date})
+            rows = cursor.fetchall()
+            columns = [column[0] for column in cursor.description]
 
-            # Get successful applications (where success_rate > 0.5)
-            cursor.execute(
-                """
-                SELECT SUM(applied_count * success_rate) / SUM(applied_count)
-                FROM adaptive_memory
-                WHERE DATE(last_applied_at) = ? AND applied_count > 0
-            """,
-                (date,),
-            )
+        kpis = [KPIMetrics(**dict(zip(columns, row))) for row in rows]
+        kpis.sort(key=lambda kpi: kpi.date, reverse=True)
 
-            avg_success = cursor.fetchone()[0] or 0.0
-        else:
-            # Calculate across ALL exceptions (all-time)
-            cursor.execute("""
-                SELECT COUNT(*) FROM adaptive_memory
-                WHERE applied_count > 0
-            """)
+        logger.info(f"Recomputed KPIs for {len(kpis)} day(s) between {start_date} and {end_date}")
+        return kpis
 
-            applications_today = cursor.fetchone()[0] or 0
+    def calculate_crs(self, date: Optional[str] = None) -> CRSCalculation:
+        """Calculate Context Retention Score.
 
-            # Get successful applications (weighted by applied_count)
-            cursor.execute("""
-                SELECT 
-                    CASE 
-                        WHEN SUM(applied_count) > 0 
-                        THEN SUM(applied_count * success_rate) / SUM(applied_count)
-                        ELSE 0.0
-                    END
-                FROM adaptive_memory
-                WHERE applied_count > 0
-            """)
+        If date is None, calculates across ALL exceptions (all-time).
+        """
+        with self._conn() as conn:
+            if date:
+                # Exceptions applied on this date
+                row = conn.execute(_SQL_CRS_DAY, (date,)).fetchone()
+            else:
+                row = conn.execute(_SQL_CRS_ALL).fetchone()
 
-            avg_success = cursor.fetchone()[0] or 0.0
+        return self._build_crs(row[0], row[1])
 
-        conn.close()
+    @staticmethod
+    def _build_crs(applications: Optional[int], avg_success: Optional[float]) -> CRSCalculation:
+        """Build a CRSCalculation from an application count and weighted success rate."""
+        applications = applications or 0
+        avg_success = avg_success or 0.0
 
         # CRS is the percentage of successful memory applications
-        crs_score = avg_success * 100 if applications_today > 0 else 0.0
+        crs_score = avg_success * 100 if applications > 0 else 0.0
 
         return CRSCalculation(
-            applicable_scenarios=applications_today,
-            successful_applications=int(applications_today * avg_success) if applications_today > 0 else 0,
+            applicable_scenarios=applications,
+            successful_applications=int(applications * avg_success) if applications > 0 else 0,
             crs_score=crs_score,
-            details=f"Applied memory {applications_today} times with {crs_score:.1f}% success rate",
+            details=f"Applied memory {applications} times with {crs_score:.1f}% success rate",
         )
 
+    @staticmethod
+    def _kpis_query(start_date: Optional[str], end_date: Optional[str]) -> tuple[str, tuple]:
+        """SQL and parameters for a KPI date-range read (most recent first)."""
+        if start_date and end_date:
+            return "SELECT * FROM kpis WHERE date BETWEEN ? AND ? ORDER BY date DESC", (start_date, end_date)
+        if start_date:
+            return "SELECT * FROM kpis WHERE date >= ? ORDER BY date DESC", (start_date,)
+        return "SELECT * FROM kpis ORDER BY date DESC LIMIT 30", ()
+
     def get_kpis(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[KPIMetrics]:
         """Get KPI metrics for a date range."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        sql, params = self._kpis_query(start_date, end_date)
+        with self._conn() as conn:
+            cursor = conn.execute(sql, params)
+            columns = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
 
-        if start_date and end_date:
-            cursor.execute(
-                """
-                SELECT * FROM kpis
-                WHERE date BETWEEN ? AND ?
-                ORDER BY date DESC
-            """,
-                (start_date, end_date),
-            )
-        elif start_date:
-            cursor.execute(
-                """
-                SELECT * FROM kpis
-                WHERE date >= ?
-                ORDER BY date DESC
-            """,
-                (start_date,),
-            )
-        else:
-            cursor.execute("""
-                SELECT * FROM kpis
-                ORDER BY date DESC
-                LIMIT 30
-            """)
+        return [KPIMetrics(**dict(zip(columns, row))) for row in rows]
 
-        rows = cursor.fetchall()
-        conn.close()
+    def get_kpis_frame(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        """Get KPI metrics for a date range as a pandas DataFrame (one column per metric).
 
-        return [KPIMetrics(**dict(row)) for row in rows]
+        Same rows as :meth:`get_kpis`, converted in bulk instead of one model per row;
+        ``date`` is parsed to datetime64.
+        """
+        try:
+            import pandas as pd
+        except ImportError as exc:
+            raise ImportError("pandas not installed. Install with `uv add pandas` to use get_kpis_frame.") from exc
+
+        sql, params = self._kpis_query(start_date, end_date)
+        with self._conn() as conn:
+            return pd.read_sql_query(sql, conn, params=params, parse_dates=["date"])
 
     def get_latest_kpis(self) -> Optional[KPIMetrics]:
         """Get the most recent KPI metrics."""
-        kpis = self.get_kpis()
-        return kpis[0] if kpis else None
+        with self._conn() as conn:
+            cursor = conn.execute("SELECT * FROM kpis ORDER BY date DESC LIMIT 1")
+            row = cursor.fetchone()
+            columns = [column[0] for column in cursor.description]
+
+        return KPIMetrics(**dict(zip(columns, row))) if row else None
@@ -9,15 +9,116 @@ Logs all LLM interactions in JSONL format with:
 
 from __future__ import annotations
 
-import json
+import atexit
 import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+import orjson
 
 
 logger = logging.getLogger(__name__)
 
+# Entries are written by one background thread shared by every GovernanceAuditLogger in the
+# process: each file gets a single append handle, and queued entries are written in batches
+# (one write per file per batch) instead of open/write/close on the calling thread.
+_MAX_BATCH_ENTRIES = 100
+# One JSONL line per entry (UTF-8, non-string keys stringified as json.dumps did)
+_ORJSON_LINE = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+# Items are (file, time.time() of the event, entry without its timestamp); None stops the writer
+_write_queue: queue.Queue[Optional[Tuple[Path, float, Dict[str, Any]]]] = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+def _start_writer() -> None:
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_write_loop, name="governance-audit-writer", daemon=True)
+            _writer_thread.start()
+            atexit.register(_stop_writer)
+
+
+def _stop_writer() -> None:
+    """Write everything still queued, then stop the writer thread."""
+    global _writer_thread
+    with _writer_lock:
+        thread, _writer_thread = _writer_thread, None
+    if thread is not None:
+        _write_queue.put(None)
+        thread.join()
+
+
+def _write_loop() -> None:
+    files: Dict[Path, BinaryIO] = {}
+    try:
+        stop = False
+        while not stop:
+            batch = [_write_queue.get()]
+            while len(batch) < _MAX_BATCH_ENTRIES:
+                try:
+                    batch.append(_write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = _write_batch(batch, files)
+            for _ in batch:
+                _write_queue.task_done()
+    finally:
+        for f in files.values():
+            f.close()
+
+
+def _write_batch(batch: List[Optional[Tuple[Path, float, Dict[str, Any]]]], files: Dict[Path, BinaryIO]) -> bool:
+    """Append a batch of entries, one write per file. Returns True if the batch asks the writer to stop."""
+    stop = False
+    lines: Dict[Path, List[bytes]] = {}
+    for item in batch:
+        if item is None:
+            stop = True
+            continue
+        file_path, logged_at, entry = item
+        try:
+            # The timestamp is formatted here, off the caller's thread, and kept as the first key
+            entry = {"timestamp": datetime.fromtimestamp(logged_at).isoformat(), **entry}
+            lines.setdefault(file_path, []).append(orjson.dumps(entry, option=_ORJSON_LINE))
+        except Exception as e:
+            logger.error(f"Failed to write audit log: {e}")
+
+    for file_path, chunk in lines.items():
+        try:
+            _append_handle(file_path, files).write(b"".join(chunk))
+        except Exception as e:
+            # Drop the handle so the next batch reopens the file
+            f = files.pop(file_path, None)
+            if f is not None:
+                f.close()
+            logger.error(f"Failed to write audit log: {e}")
+    return stop
+
+
+def _append_handle(file_path: Path, files: Dict[Path, BinaryIO]) -> BinaryIO:
+    """Return the cached append handle for a file, reopening it if the file was rotated or deleted."""
+    f = files.get(file_path)
+    if f is not None:
+        try:
+            on_disk, opened = os.stat(file_path), os.fstat(f.fileno())
+            if (on_disk.st_dev, on_disk.st_ino) == (opened.st_dev, opened.st_ino):
+                return f
+        except OSError:
+            pass
+        f.close()
+    # Unbuffered, so each batch is a single O_APPEND write and lines never interleave
+    f = files[file_path] = open(file_path, "ab", buffering=0)
+    return f
+
 
 class GovernanceAuditLogger:
     """Enhanced audit logger for AI governance."""
@@ -29,6 +130,13 @@ class GovernanceAuditLogger:
         # Also create violations log
         self.violations_file = self.log_file.parent / "governance_violations.jsonl"
 
+        # get_statistics folds only lines appended since the last call into these running
+        # totals (total_calls, violations, total_cost, by_agent); the log is append-only
+        self._stats_lock = threading.Lock()
+        self._stats_file_id: Optional[Tuple[int, int]] = None
+        self._stats_offset = 0
+        self._stats_totals: Tuple[int, int, float, Dict[str, Dict[str, int]]] = (0, 0, 0.0, {})
+
         logger.info(f"Governance Audit Logger initialized: {self.log_file}")
 
     def log_llm_call(
@@ -62,8 +170,8 @@ class GovernanceAuditLogger:
             user_id: User identifier
             cost_estimate: Estimated cost in USD
         """
+        logged_at = time.time()
         entry = {
-            "timestamp": datetime.now().isoformat(),
             "trace_id": trace_id,
             "user_id": user_id,
             "agent_name": agent_name,
@@ -82,11 +190,11 @@ class GovernanceAuditLogger:
         }
 
         # Write to main audit log
-        self._write_entry(self.log_file, entry)
+        self._write_entry(self.log_file, entry, logged_at)
 
         # If violations, also write to violations log
         if not input_valid or not output_valid:
-            self._write_entry(self.violations_file, entry)
+            self._write_entry(self.violations_file, entry, logged_at)
             logger.warning(
                 f"Governance violation in {agent_name}: input={input_violations}, output={output_violations}"
             )
@@ -107,43 +215,44 @@ class GovernanceAuditLogger:
             severity: Event severity (info, warning, error)
         """
         entry = {
-            "timestamp": datetime.now().isoformat(),
             "event_type": event_type,
             "agent_name": agent_name,
             "severity": severity,
             "details": details,
         }
 
-        self._write_entry(self.violations_file, entry)
+        self._write_entry(self.violations_file, entry, time.time())
 
-    def _write_entry(self, file_path: Path, entry: Dict[str, Any]) -> None:
-        """Write a JSONL entry to file."""
-        try:
-            with open(file_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-        except Exception as e:
-            logger.error(f"Failed to write audit log: {e}")
+    def _write_entry(self, file_path: Path, entry: Dict[str, Any], logged_at: float) -> None:
+        """Queue a JSONL entry for the background writer, which adds its ``timestamp``."""
+        if _writer_thread is None:
+            _start_writer()
+        _write_queue.put((file_path, logged_at, entry))
+
+    def flush(self) -> None:
+        """Block until every queued audit entry has been written."""
+        if _writer_thread is not None:
+            _write_queue.join()
 
     def get_recent_violations(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent governance violations.
 
         Args:
-            limit: Number of violations to return
+            limit: Number of violations to return (0 returns all of them)
 
         Returns:
             List of violation entries
         """
+        self.flush()
         if not self.violations_file.exists():
             return []
 
         try:
-            violations = []
-            with open(self.violations_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    violations.append(json.loads(line))
+            # Keep only the most recent lines while reading, and parse just those
+            with open(self.violations_file, "rb") as f:
+                lines = deque(f, maxlen=limit or None)
 
-            # Return most recent
-            return violations[-limit:] if len(violations) > limit else violations
+            return [orjson.loads(line) for line in lines]
 
         except Exception as e:
             logger.error(f"Failed to read violations: {e}")
@@ -155,6 +264,7 @@ class GovernanceAuditLogger:
         Returns:
             Dictionary with governance metrics
         """
+        self.flush()
         if not self.log_file.exists():
             return {
                 "total_calls": 0,
@@ -163,14 +273,24 @@ class GovernanceAuditLogger:
             }
 
         try:
-            total_calls = 0
-            violations = 0
-            total_cost = 0.0
-            by_agent = {}
-
-            with open(self.log_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    entry = json.loads(line)
+            with self._stats_lock:
+                with open(self.log_file, "rb") as f:
+                    st = os.fstat(f.fileno())
+                    file_id = (st.st_dev, st.st_ino)
+                    if file_id != self._stats_file_id or st.st_size < self._stats_offset:
+                        # A different (rotated/replaced) or truncated log; count it again from the start
+                        self._stats_file_id = file_id
+                        self._stats_offset = 0
+                        self._stats_totals = (0, 0, 0.0, {})
+                    f.seek(self._stats_offset)
+                    data = f.read()
+                # Only complete lines; a partial last line is picked up by the next call
+                end = data.rfind(b"\n") + 1
+
+                total_calls, violations, total_cost, by_agent = self._stats_totals
+                by_agent = {agent: dict(counts) for agent, counts in by_agent.items()}
+                for line in data[:end].splitlines():
+                    entry = orjson.loads(line)
                     total_calls += 1
 
                     if entry.get("governance_status") == "violation":
@@ -185,6 +305,9 @@ class GovernanceAuditLogger:
                     if entry.get("governance_status") == "violation":
                         by_agent[agent]["violations"] += 1
 
+                self._stats_offset += end
+                self._stats_totals = (total_calls, violations, total_cost, by_agent)
+
             violation_rate = (violations / total_calls * 100) if total_calls > 0 else 0.0
 
             return {
@@ -192,7 +315,7 @@ class GovernanceAuditLogger:
                 "violations": violations,
                 "violation_rate": violation_rate,
                 "total_cost_usd": total_cost,
-                "by_agent": by_agent,
+                "by_agent": {agent: dict(counts) for agent, counts in by_agent.items()},
             }
 
         except Exception as e:
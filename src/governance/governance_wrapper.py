@@ -16,7 +16,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 from ..core.config import get_settings
-from ..core.openrouter_client import OpenRouterClient
+from ..core.openrouter_client import OpenRouterClient, get_openrouter_client
 from .audit_logger import GovernanceAuditLogger
 from .input_validator import InputValidator
 from .output_validator import OutputValidator
@@ -24,6 +24,18 @@ from .output_validator import OutputValidator
 
 logger = logging.getLogger(__name__)
 
+# Approximate USD price per prompt/response character: cost per 1K tokens at ~4 chars per token
+_COST_PER_CHAR = {
+    model: cost_per_1k / 4 / 1000
+    for model, cost_per_1k in {
+        "openai/gpt-4o": 0.005,  # $5/1M tokens input
+        "openai/gpt-4-vision-preview": 0.01,
+        "anthropic/claude-3.5-sonnet": 0.003,
+        "meta-llama/llama-3.1-70b-instruct": 0.0005,
+    }.items()
+}
+_DEFAULT_COST_PER_CHAR = _COST_PER_CHAR["openai/gpt-4o"]
+
 
 class GovernanceWrapper:
     """Governance wrapper for LLM API calls.
@@ -44,7 +56,10 @@ class GovernanceWrapper:
         output_validator: Optional[OutputValidator] = None,
     ):
         self.settings = get_settings()
-        self.llm_client = llm_client or OpenRouterClient()
+        # Default to the shared client so its connection pool is reused across wrappers;
+        # it is closed on app shutdown, never by close()
+        self.llm_client = llm_client or get_openrouter_client()
+        self._owns_llm_client = llm_client is not None and llm_client is not get_openrouter_client()
         self.audit_logger = audit_logger or GovernanceAuditLogger()
         self.input_validator = input_validator or InputValidator()
         self.output_validator = output_validator or OutputValidator()
@@ -242,23 +257,8 @@ class GovernanceWrapper:
         Returns:
             Estimated cost in USD
         """
-        # Rough token estimation (1 token ≈ 4 chars)
-        prompt_tokens = len(prompt) / 4
-        response_tokens = len(response) / 4
-
-        # Cost per 1K tokens (approximate)
-        cost_per_1k = {
-            "openai/gpt-4o": 0.005,  # $5/1M tokens input
-            "openai/gpt-4-vision-preview": 0.01,
-            "anthropic/claude-3.5-sonnet": 0.003,
-            "meta-llama/llama-3.1-70b-instruct": 0.0005,
-        }
-
-        rate = cost_per_1k.get(model, 0.005)  # Default to GPT-4o rate
-
-        total_cost = ((prompt_tokens + response_tokens) / 1000) * rate
-
-        return round(total_cost, 6)
+        # Kept at full precision so summed costs don't accumulate rounding error; round for display
+        return (len(prompt) + len(response)) * _COST_PER_CHAR.get(model, _DEFAULT_COST_PER_CHAR)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get governance statistics.
@@ -291,9 +291,9 @@ class GovernedLLMClient:
     comprehensive governance controls.
     """
 
-    def __init__(self, agent_name: str = "unknown"):
+    def __init__(self, agent_name: str = "unknown", llm_client: Optional[OpenRouterClient] = None):
         self.agent_name = agent_name
-        self.governance = GovernanceWrapper()
+        self.governance = GovernanceWrapper(llm_client=llm_client)
         logger.info(f"Governed LLM Client initialized for {agent_name}")
 
     def completion(
@@ -324,5 +324,6 @@ class GovernedLLMClient:
         return self.governance.get_statistics()
 
     def close(self) -> None:
-        """Close underlying LLM client."""
-        self.governance.llm_client.close()
+        """Close underlying LLM client (the shared default client is closed on app shutdown)."""
+        if self.governance._owns_llm_client:
+            self.governance.llm_client.close()
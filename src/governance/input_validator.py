@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
 logger = logging.getLogger(__name__)
@@ -20,24 +20,40 @@ logger = logging.getLogger(__name__)
 class InputValidator:
     """Validates LLM inputs for governance compliance."""
 
-    def __init__(self):
-        # PII patterns
-        self.pii_patterns = {
-            "email": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-            "ssn": r"\b\d{3}-\d{2}-\d{4}\b",
-            "credit_card": r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b",
-            "phone": r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b",
-            "iban": r"\b[A-Z]{2}\d{2}[A-Z0-9]{10,30}\b",
+    def __init__(self, forbidden_words: Optional[List[str]] = None):
+        # PII patterns (compiled once; validate() runs on every governed LLM call)
+        self.pii_patterns: Dict[str, re.Pattern[str]] = {
+            pii_type: re.compile(pattern)
+            for pii_type, pattern in {
+                "email": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
+                "ssn": r"\b\d{3}-\d{2}-\d{4}\b",
+                "credit_card": r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b",
+                "phone": r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b",
+                "iban": r"\b[A-Z]{2}\d{2}[A-Z0-9]{10,30}\b",
+            }.items()
         }
+        # All PII patterns as one alternation of named groups, so one scan finds every type
+        self._pii_combined = re.compile(
+            "|".join(f"(?P<{pii_type}>{pattern.pattern})" for pii_type, pattern in self.pii_patterns.items())
+        )
+        self._pii_redactions = {pii_type: f"[{pii_type.upper()}_REDACTED]" for pii_type in self.pii_patterns}
 
         # Forbidden words (sensitive data markers)
-        self.forbidden_words = [
+        self.forbidden_words = forbidden_words or [
             "password",
             "secret_key",
             "api_key",
             "private_key",
             "access_token",
         ]
+        # Forbidden words as one case-insensitive alternation inside a lookahead, so a prompt is
+        # scanned once and overlapping words are all found. Only the longest word starting at a
+        # position can match there, so words contained in another entry are checked with `in`.
+        lowered = {word.lower() for word in self.forbidden_words}
+        self._nested_forbidden = [word for word in lowered if any(word != other and word in other for other in lowered)]
+        scanned = sorted(lowered.difference(self._nested_forbidden), key=len, reverse=True)
+        self._forbidden_scan_count = len(scanned)
+        self._forbidden_pattern = re.compile(f"(?=({'|'.join(re.escape(word) for word in scanned)}))", re.IGNORECASE)
 
         # Prompt constraints
         self.min_prompt_length = 5
@@ -90,14 +106,12 @@ class InputValidator:
         Returns:
             Dictionary of PII type -> list of matches
         """
-        detected = {}
+        found: Dict[str, List[str]] = {}
+        for match in self._pii_combined.finditer(text):
+            found.setdefault(match.lastgroup, []).append(match.group())
 
-        for pii_type, pattern in self.pii_patterns.items():
-            matches = re.findall(pattern, text)
-            if matches:
-                detected[pii_type] = matches
-
-        return detected
+        # Report types in pattern order, as before the patterns were combined
+        return {pii_type: found[pii_type] for pii_type in self.pii_patterns if pii_type in found}
 
     def _detect_forbidden_words(self, text: str) -> List[str]:
         """Detect forbidden words in text.
@@ -105,14 +119,16 @@ class InputValidator:
         Returns:
             List of forbidden words found
         """
-        text_lower = text.lower()
-        found = []
-
-        for word in self.forbidden_words:
-            if word.lower() in text_lower:
-                found.append(word)
+        hits = set()
+        for match in self._forbidden_pattern.finditer(text):
+            hits.add(match.group(1).lower())
+            if len(hits) == self._forbidden_scan_count:
+                break
+        if self._nested_forbidden:
+            lowered = text.lower()
+            hits.update(word for word in self._nested_forbidden if word in lowered)
 
-        return found
+        return [word for word in self.forbidden_words if word.lower() in hits]
 
     def redact_pii(self, text: str) -> str:
         """Redact PII from text for safe logging.
@@ -123,21 +139,6 @@ class InputValidator:
         Returns:
             Text with PII redacted
         """
-        redacted = text
-
-        # Redact emails
-        redacted = re.sub(self.pii_patterns["email"], "[EMAIL_REDACTED]", redacted)
-
-        # Redact SSNs
-        redacted = re.sub(self.pii_patterns["ssn"], "[SSN_REDACTED]", redacted)
-
-        # Redact credit cards
-        redacted = re.sub(self.pii_patterns["credit_card"], "[CREDIT_CARD_REDACTED]", redacted)
-
-        # Redact phones
-        redacted = re.sub(self.pii_patterns["phone"], "[PHONE_REDACTED]", redacted)
-
-        # Redact IBANs
-        redacted = re.sub(self.pii_patterns["iban"], "[IBAN_REDACTED]", redacted)
-
-        return redacted
+        # One sweep; the matching group names the PII type
+        redactions = self._pii_redactions
+        return self._pii_combined.sub(lambda match: redactions[match.lastgroup], text)
@@ -32,13 +32,21 @@ class OutputValidator:
             "offensive_term_2",
         ]
 
-        # PII patterns (same as input)
-        self.pii_patterns = {
-            "email": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-            "ssn": r"\b\d{3}-\d{2}-\d{4}\b",
-            "credit_card": r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b",
-            "phone": r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b",
+        # PII patterns (same as input), compiled once
+        self.pii_patterns: Dict[str, re.Pattern[str]] = {
+            pii_type: re.compile(pattern)
+            for pii_type, pattern in {
+                "email": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
+                "ssn": r"\b\d{3}-\d{2}-\d{4}\b",
+                "credit_card": r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b",
+                "phone": r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b",
+            }.items()
         }
+        # All PII patterns as one alternation of named groups, for single-pass redaction
+        self._pii_combined = re.compile(
+            "|".join(f"(?P<{pii_type}>{pattern.pattern})" for pii_type, pattern in self.pii_patterns.items())
+        )
+        self._pii_redactions = {pii_type: f"[{pii_type.upper()}_REDACTED]" for pii_type in self.pii_patterns}
 
         logger.info("Output Validator initialized")
 
@@ -86,7 +94,7 @@ class OutputValidator:
         detected = {}
 
         for pii_type, pattern in self.pii_patterns.items():
-            matches = re.findall(pattern, text)
+            matches = pattern.findall(text)
             if matches:
                 detected[pii_type] = matches
 
@@ -126,9 +134,6 @@ class OutputValidator:
 
     def redact_pii(self, text: str) -> str:
         """Redact PII from text for safe logging."""
-        redacted = text
-
-        for pii_type, pattern in self.pii_patterns.items():
-            redacted = re.sub(pattern, f"[{pii_type.upper()}_REDACTED]", redacted)
-
-        return redacted
+        # One sweep; the matching group names the PII type
+        redactions = self._pii_redactions
+        return self._pii_combined.sub(lambda match: redactions[match.lastgroup], text)
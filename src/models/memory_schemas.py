@@ -16,6 +16,8 @@ class MemoryQuery(BaseModel):
     amount_range: Optional[tuple[float, float]] = None
     rule_type: Optional[str] = None
     min_success_rate: float = 0.5
+    limit: Optional[int] = Field(default=None, ge=1)  # Page size; None returns all matches
+    after_id: Optional[str] = None  # Keyset cursor: continue after this exception_id
 
 
 class MemoryStats(BaseModel):
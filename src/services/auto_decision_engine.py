@@ -4,7 +4,7 @@ import logging
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Tuple
 
-from ..core.config import Settings, get_settings
+from ..core.config import SettingsSnapshot, get_settings
 from ..db.memory_db import MemoryDatabase
 from ..models.memory_schemas import MemoryQuery
 from ..models.schemas import (
@@ -49,7 +49,7 @@ class AutoDecisionEngine:
     def __init__(
         self,
         memory_db: Optional[MemoryDatabase] = None,
-        settings: Optional[Settings] = None,
+        settings: Optional[SettingsSnapshot] = None,
     ):
         self.settings = settings or get_settings()
         self.memory_db = memory_db or MemoryDatabase(self.settings.memory_db_path)
@@ -47,8 +47,10 @@ class KPITracker:
         Returns:
             List of KPIMetrics, most recent first
         """
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        # One clock read, so the window can't straddle midnight
+        now = datetime.now()
+        end_date = now.strftime("%Y-%m-%d")
+        start_date = (now - timedelta(days=days)).strftime("%Y-%m-%d")
 
         return self.db.get_kpis(start_date, end_date)
 
@@ -170,43 +172,7 @@ class KPITracker:
 
     def get_transaction_stats(self) -> Dict[str, Any]:
         """Get transaction statistics."""
-        import sqlite3
-
-        conn = sqlite3.connect(self.db.db_path)
-        cursor = conn.cursor()
-
-        # Total transactions
-        cursor.execute("SELECT COUNT(*) FROM transactions")
-        total = cursor.fetchone()[0]
-
-        # By decision type
-        cursor.execute("""
-            SELECT final_decision, COUNT(*) 
-            FROM transactions 
-            GROUP BY final_decision
-        """)
-        by_decision = dict(cursor.fetchall())
-
-        # By risk level
-        cursor.execute("""
-            SELECT risk_level, COUNT(*) 
-            FROM transactions 
-            GROUP BY risk_level
-        """)
-        by_risk = dict(cursor.fetchall())
-
-        # Average processing time
-        cursor.execute("SELECT AVG(processing_time_ms) FROM transactions")
-        avg_time = cursor.fetchone()[0] or 0
-
-        conn.close()
-
-        return {
-            "total_transactions": total,
-            "by_decision": by_decision,
-            "by_risk_level": by_risk,
-            "avg_processing_time_ms": int(avg_time),
-        }
+        return self.db.get_transaction_stats()
 
     def force_recalculate_all_kpis(self) -> Dict[str, Any]:
         """Recalculate KPIs for all dates with transactions.
@@ -216,35 +182,15 @@ class KPITracker:
         Returns:
             Summary of recalculation
         """
-        import sqlite3
-
-        conn = sqlite3.connect(self.db.db_path)
-        cursor = conn.cursor()
-
-        # Get all unique dates
-        cursor.execute("""
-            SELECT DISTINCT DATE(created_at) as date 
-            FROM transactions 
-            ORDER BY date
-        """)
-        dates = [row[0] for row in cursor.fetchall()]
-        conn.close()
-
-        recalculated = []
-        for date in dates:
-            kpi = self.db.calculate_and_save_kpis(date)
-            recalculated.append(
-                {
-                    "date": date,
-                    "hcr": kpi.hcr,
-                    "crs": kpi.crs,
-                    "atar": kpi.atar,
-                }
-            )
-
-        logger.info(f"Recalculated KPIs for {len(dates)} dates")
+        # One grouped aggregate and upsert over every day that has transactions
+        kpis = self.db.recompute_kpis("0001-01-01", "9999-12-31")
+        kpis.reverse()
+
+        recalculated = [{"date": kpi.date, "hcr": kpi.hcr, "crs": kpi.crs, "atar": kpi.atar} for kpi in kpis]
+
+        logger.info(f"Recalculated KPIs for {len(kpis)} dates")
 
         return {
-            "recalculated_dates": len(dates),
+            "recalculated_dates": len(kpis),
             "kpis": recalculated,
         }
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
-from collections import Counter
+from collections import Counter, deque
 from pathlib import Path
 from typing import Any, Dict, List
 from datetime import datetime
 
 import httpx
+import orjson
 
 from ..core.config import get_settings
 from ..governance.audit_logger import GovernanceAuditLogger
@@ -186,13 +186,13 @@ class LangfuseInsights:
             return []
 
         try:
-            with open(self.audit_log_path, "r", encoding="utf-8") as file:
-                lines = file.readlines()[-limit:]
+            with open(self.audit_log_path, "rb") as file:
+                lines = deque(file, maxlen=limit or None)  # limit=0 reads the whole log
             events: List[Dict[str, Any]] = []
             for line in lines:
                 try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError:
+                    events.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
                     continue
             return events
         except Exception:
@@ -203,16 +203,16 @@ class LangfuseInsights:
             return []
 
         try:
-            with open(self.violations_path, "r", encoding="utf-8") as file:
-                lines = file.readlines()[-limit:]
+            with open(self.violations_path, "rb") as file:
+                lines = deque(file, maxlen=limit or None)
             events: List[Dict[str, Any]] = []
             for line in lines:
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError:
+                    events.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
                     continue
             return events
         except Exception:
@@ -0,0 +1,150 @@
+"""Unit tests for Governance Audit Logger."""
+
+import os
+from datetime import datetime
+
+import orjson
+import pytest
+
+from src.governance.audit_logger import GovernanceAuditLogger
+
+
+@pytest.fixture
+def audit_logger(tmp_path):
+    """Create an audit logger writing into a temporary directory."""
+    return GovernanceAuditLogger(log_file=str(tmp_path / "governance_audit.jsonl"))
+
+
+def _log_call(audit_logger, agent_name="TAA", valid=True, cost=0.01):
+    audit_logger.log_llm_call(
+        agent_name=agent_name,
+        prompt="prompt",
+        response="response",
+        model="test-model",
+        input_valid=valid,
+        input_violations=[] if valid else ["forbidden word"],
+        output_valid=True,
+        output_violations=[],
+        processing_time_ms=5,
+        cost_estimate=cost,
+    )
+
+
+def _read_lines(path):
+    return [orjson.loads(line) for line in path.read_bytes().splitlines()]
+
+
+def test_flush_writes_every_entry(audit_logger):
+    """After flush, every queued entry is on disk as one JSONL line."""
+    for _ in range(250):
+        _log_call(audit_logger)
+    audit_logger.flush()
+
+    entries = _read_lines(audit_logger.log_file)
+    assert len(entries) == 250
+    assert all(entry["agent_name"] == "TAA" for entry in entries)
+
+
+def test_writer_formats_timestamp_first(audit_logger):
+    """The writer adds the ISO timestamp of the logged event as the first key."""
+    logged_at = 1_700_000_000.5
+    audit_logger._write_entry(audit_logger.log_file, {"event_type": "test"}, logged_at)
+    audit_logger.flush()
+
+    (entry,) = _read_lines(audit_logger.log_file)
+    assert list(entry) == ["timestamp", "event_type"]
+    assert entry["timestamp"] == datetime.fromtimestamp(logged_at).isoformat()
+
+
+def test_writer_reopens_rotated_and_deleted_files(audit_logger):
+    """Entries written after the log is rotated or deleted land in a fresh file at the original path."""
+    _log_call(audit_logger)
+    audit_logger.flush()
+
+    rotated = audit_logger.log_file.with_suffix(".jsonl.1")
+    os.replace(audit_logger.log_file, rotated)
+    _log_call(audit_logger)
+    _log_call(audit_logger)
+    audit_logger.flush()
+
+    assert len(_read_lines(rotated)) == 1
+    assert len(_read_lines(audit_logger.log_file)) == 2
+
+    audit_logger.log_file.unlink()
+    _log_call(audit_logger)
+    audit_logger.flush()
+
+    assert len(_read_lines(audit_logger.log_file)) == 1
+
+
+def test_get_statistics_counts_appended_entries(audit_logger):
+    """Entries appended between calls are added to the running totals."""
+    _log_call(audit_logger, agent_name="TAA")
+    _log_call(audit_logger, agent_name="PAA", valid=False)
+    stats = audit_logger.get_statistics()
+    assert stats["total_calls"] == 2
+    assert stats["violations"] == 1
+
+    _log_call(audit_logger, agent_name="TAA", cost=0.5)
+    stats = audit_logger.get_statistics()
+
+    assert stats["total_calls"] == 3
+    assert stats["violations"] == 1
+    assert stats["total_cost_usd"] == pytest.approx(0.52)
+    assert stats["by_agent"] == {"TAA": {"calls": 2, "violations": 0}, "PAA": {"calls": 1, "violations": 1}}
+
+
+def test_get_statistics_recounts_truncated_log(audit_logger):
+    """A log truncated between calls is counted again from the start."""
+    for _ in range(3):
+        _log_call(audit_logger)
+    assert audit_logger.get_statistics()["total_calls"] == 3
+
+    lines = audit_logger.log_file.read_bytes().splitlines(keepends=True)
+    audit_logger.log_file.write_bytes(lines[0])
+
+    assert audit_logger.get_statistics()["total_calls"] == 1
+
+
+def test_get_statistics_recounts_replaced_log(audit_logger, tmp_path):
+    """A log replaced by a different (even larger) file is counted again from the start."""
+    _log_call(audit_logger)
+    assert audit_logger.get_statistics()["total_calls"] == 1
+
+    replacement = tmp_path / "replacement.jsonl"
+    entry = {"agent_name": "EMA", "governance_status": "violation", "cost_estimate_usd": 0.0}
+    replacement.write_bytes(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE) * 20)
+    assert replacement.stat().st_size > audit_logger.log_file.stat().st_size
+    os.replace(replacement, audit_logger.log_file)
+
+    stats = audit_logger.get_statistics()
+    assert stats["total_calls"] == 20
+    assert stats["violations"] == 20
+    assert stats["by_agent"] == {"EMA": {"calls": 20, "violations": 20}}
+
+
+def test_get_statistics_defers_partial_last_line(audit_logger):
+    """A half-written last line is skipped until it is completed."""
+    _log_call(audit_logger)
+    audit_logger.flush()
+
+    line = orjson.dumps({"agent_name": "PAA", "governance_status": "pass", "cost_estimate_usd": 0.0}) + b"\n"
+    with open(audit_logger.log_file, "ab") as f:
+        f.write(line[:10])
+    assert audit_logger.get_statistics()["total_calls"] == 1
+
+    with open(audit_logger.log_file, "ab") as f:
+        f.write(line[10:])
+    stats = audit_logger.get_statistics()
+
+    assert stats["total_calls"] == 2
+    assert stats["by_agent"]["PAA"] == {"calls": 1, "violations": 0}
+
+
+def test_get_recent_violations_limit(audit_logger):
+    """Only the newest violations are returned; a limit of 0 returns all of them."""
+    for agent_name in ["TAA", "PAA", "EMA"]:
+        _log_call(audit_logger, agent_name=agent_name, valid=False)
+
+    assert [v["agent_name"] for v in audit_logger.get_recent_violations(limit=2)] == ["PAA", "EMA"]
+    assert [v["agent_name"] for v in audit_logger.get_recent_violations(limit=0)] == ["TAA", "PAA", "EMA"]
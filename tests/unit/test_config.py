@@ -0,0 +1,25 @@
+"""Unit tests for application settings."""
+
+import dataclasses
+
+import pytest
+
+from src.core.config import Settings, SettingsSnapshot
+
+
+def test_settings_snapshot_mirrors_settings_fields():
+    """The snapshot exposes exactly the fields declared on Settings."""
+    snapshot_fields = {field.name for field in dataclasses.fields(SettingsSnapshot)}
+
+    assert snapshot_fields == set(Settings.model_fields)
+
+
+def test_settings_snapshot_is_frozen_copy_of_settings():
+    """A snapshot built from Settings keeps its values and rejects assignment."""
+    settings = Settings(openrouter_api_key="test-key", fallback_model_3="")
+    snapshot = SettingsSnapshot(**settings.model_dump())
+
+    assert snapshot.openrouter_api_key == "test-key"
+    assert snapshot.fallback_models == [settings.fallback_model_1, settings.fallback_model_2]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.api_port = 9000
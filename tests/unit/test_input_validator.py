@@ -0,0 +1,38 @@
+"""Unit tests for Input Validator."""
+
+from src.governance.input_validator import InputValidator
+
+
+def test_detects_default_forbidden_words_case_insensitively():
+    """Default forbidden words are reported in declaration order, whatever their case."""
+    validator = InputValidator()
+
+    found = validator._detect_forbidden_words("Send the ACCESS_TOKEN and the Password")
+
+    assert found == ["password", "access_token"]
+
+
+def test_detects_nested_and_overlapping_forbidden_words():
+    """Words inside, at the start of, or overlapping other words are all detected."""
+    validator = InputValidator(forbidden_words=["key", "api_key", "api", "secret", "secretive", "tok", "token"])
+
+    assert validator._detect_forbidden_words("the api_key is here") == ["key", "api_key", "api"]
+    assert validator._detect_forbidden_words("a secretive token") == ["secret", "secretive", "tok", "token"]
+    assert validator._detect_forbidden_words("nothing to see") == []
+
+
+def test_detects_overlapping_forbidden_words():
+    """Two words sharing characters in the prompt are both reported."""
+    validator = InputValidator(forbidden_words=["passw", "sword"])
+
+    assert validator._detect_forbidden_words("my password") == ["passw", "sword"]
+
+
+def test_validate_reports_forbidden_words():
+    """validate() fails prompts that contain forbidden words."""
+    validator = InputValidator()
+
+    is_valid, violations = validator.validate("Here is my api_key for the vendor portal", agent_name="TAA")
+
+    assert not is_valid
+    assert violations == ["Forbidden words detected: api_key"]
@@ -1,5 +1,6 @@
 """Unit tests for Memory Database."""
 
+import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -8,6 +9,17 @@ import pytest
 
 from src.db.memory_db import MemoryDatabase
 from src.models.memory_schemas import MemoryQuery
+from src.models.schemas import (
+    DecisionType,
+    Invoice,
+    LineItem,
+    PolicyCheckResult,
+    RAGTriadMetrics,
+    RetrievedSource,
+    RiskAssessment,
+    RiskLevel,
+    TransactionResult,
+)
 
 
 @pytest.fixture
@@ -100,10 +112,27 @@ def test_update_exception_usage(temp_db):
     assert exceptions[0].success_rate == 0.5  # 1 success out of 2 attempts
 
 
+def test_query_exceptions_returns_datetimes(temp_db):
+    """Test that timestamps are converted to datetime by the registered SQLite converter."""
+    exception_id = temp_db.add_exception(
+        vendor="Clock Vendor", category="Test", rule_type="recurring", description="Test exception", condition={}
+    )
+
+    exception = temp_db.query_exceptions(MemoryQuery(vendor="Clock Vendor"))[0]
+    assert isinstance(exception.created_at, datetime)
+    assert exception.last_applied_at is None
+
+    temp_db.update_exception_usage(exception_id, success=True)
+
+    exception = temp_db.query_exceptions(MemoryQuery(vendor="Clock Vendor"))[0]
+    assert isinstance(exception.last_applied_at, datetime)
+    assert exception.last_applied_at >= exception.created_at
+
+
 def test_get_memory_stats(temp_db):
     """Test getting memory statistics."""
     # Add some exceptions
-    temp_db.add_exception(
+    exception_id1 = temp_db.add_exception(
         vendor="Vendor 1", category="Cat 1", rule_type="recurring", description="Exception 1", condition={}
     )
 
@@ -121,19 +150,82 @@ def test_get_memory_stats(temp_db):
     assert stats.active_exceptions == 1  # Only one has been applied
     assert stats.total_applications == 1
 
+    # Both top-5 lists come back from the same query
+    assert stats.most_applied_rules == [
+        {"exception_id": exception_id2, "description": "Exception 2", "applied_count": 1, "success_rate": 1.0}
+    ]
+    assert {rule["exception_id"] for rule in stats.recent_additions} == {exception_id1, exception_id2}
+    assert all("created_at" in rule for rule in stats.recent_additions)
 
-def test_calculate_kpis(temp_db):
-    """Test KPI calculation."""
-    from src.models.schemas import (
-        Invoice,
-        RiskAssessment,
-        RiskLevel,
-        PolicyCheckResult,
-        TransactionResult,
-        DecisionType,
-        LineItem,
+
+def test_get_memory_stats_aggregates(temp_db):
+    """The single aggregate pass averages only applied rules and skips soft-deleted ones."""
+    applied_ok, applied_failed, unused, deleted = (
+        temp_db.add_exception(
+            vendor="Stats Vendor", category="Cat", rule_type="recurring", description=f"Rule {i}", condition={}
+        )
+        for i in range(4)
+    )
+    temp_db.update_exception_usage(applied_ok, success=True)
+    temp_db.update_exception_usage(applied_failed, success=False)
+    temp_db.update_exception_usage(deleted, success=True)
+    temp_db.delete_exception(deleted)
+
+    stats = temp_db.get_memory_stats()
+
+    assert stats.total_exceptions == 3
+    assert stats.active_exceptions == 2
+    assert stats.total_applications == 2
+    assert stats.avg_success_rate == pytest.approx(0.5)
+    assert unused not in {rule["exception_id"] for rule in stats.most_applied_rules}
+
+
+def test_calculate_crs(temp_db):
+    """CRS weights each rule's success rate by how often it was applied."""
+    reliable = temp_db.add_exception(
+        vendor="Vendor A", category="Test", rule_type="recurring", description="Reliable rule", condition={}
+    )
+    flaky = temp_db.add_exception(
+        vendor="Vendor B", category="Test", rule_type="recurring", description="Flaky rule", condition={}
+    )
+    temp_db.add_exception(vendor="Vendor C", category="Test", rule_type="recurring", description="Unused", condition={})
+
+    temp_db.update_exception_usage(reliable, success=True)
+    temp_db.update_exception_usage(reliable, success=True)
+    temp_db.update_exception_usage(flaky, success=False)
+
+    crs = temp_db.calculate_crs()
+    assert crs.applicable_scenarios == 2  # unused rules are not counted
+    assert crs.crs_score == pytest.approx(200 / 3)
+
+    assert temp_db.calculate_crs(datetime.now().strftime("%Y-%m-%d")).crs_score == pytest.approx(200 / 3)
+    assert temp_db.calculate_crs("2000-01-01").crs_score == 0.0
+
+
+def test_calculate_crs_for_day(temp_db):
+    """A day's CRS only aggregates rules last applied on that day."""
+    today = temp_db.add_exception(
+        vendor="Vendor A", category="Test", rule_type="recurring", description="Applied today", condition={}
+    )
+    earlier = temp_db.add_exception(
+        vendor="Vendor B", category="Test", rule_type="recurring", description="Applied earlier", condition={}
     )
+    temp_db.update_exception_usage(today, success=True)
+    temp_db.update_exception_usage(earlier, success=False)
+    with temp_db._write_conn() as conn:
+        conn.execute(
+            "UPDATE adaptive_memory SET last_applied_at = '2000-01-01 12:00:00' WHERE exception_id = ?", (earlier,)
+        )
+
+    day = temp_db.calculate_crs(datetime.now().strftime("%Y-%m-%d"))
+    assert (day.applicable_scenarios, day.crs_score) == (1, 100.0)
+    earlier_day = temp_db.calculate_crs("2000-01-01")
+    assert (earlier_day.applicable_scenarios, earlier_day.crs_score) == (1, 0.0)
+    assert temp_db.calculate_crs().crs_score == pytest.approx(50.0)
+
 
+def test_calculate_kpis(temp_db):
+    """Test KPI calculation."""
     # Create a test transaction
     invoice = Invoice(
         invoice_id="TEST-001",
@@ -183,21 +275,18 @@ def test_calculate_kpis(temp_db):
     assert kpis.atar == 100.0  # 100% auto-approved
     assert kpis.audit_traceability_score == 100.0
 
+    # A day without transactions falls back to all-time figures (same statement)
+    fallback = temp_db.calculate_and_save_kpis("2000-01-01")
+    assert fallback.date == "2000-01-01"
+    assert fallback.total_transactions == 1
+    assert fallback.atar == 100.0
+
+    # Latest is the most recent date, not the most recently saved row
+    assert temp_db.get_latest_kpis() == kpis
+
 
 def test_transaction_persists_policy_check_metadata(temp_db):
     """Ensure policy_check JSON is stored and hydrated when retrieving transactions."""
-    from src.models.schemas import (
-        Invoice,
-        RiskAssessment,
-        RiskLevel,
-        PolicyCheckResult,
-        TransactionResult,
-        DecisionType,
-        LineItem,
-        RetrievedSource,
-        RAGTriadMetrics,
-    )
-
     invoice = Invoice(
         invoice_id="TEST-002",
         vendor="Policy Corp",
@@ -275,8 +364,6 @@ def test_transaction_persists_policy_check_metadata(temp_db):
 
 def test_pending_transaction_queue(temp_db):
     """Round-trip pending queue operations."""
-    from src.models.schemas import Invoice, LineItem
-
     invoice = Invoice(
         invoice_id="PEND-001",
         vendor="Queue Vendor",
@@ -309,3 +396,268 @@ def test_pending_transaction_queue(temp_db):
     )
 
     assert temp_db.count_pending_transactions() == 0
+
+
+def test_save_transactions_bulk(temp_db):
+    """Bulk-saved transactions are all persisted."""
+    invoice = Invoice(
+        invoice_id="BULK-001",
+        vendor="Bulk Vendor",
+        vendor_reputation=75,
+        amount=500.0,
+        currency="USD",
+        category="Office",
+        date="2025-11-06",
+        po_number="PO-BULK",
+        line_items=[LineItem(description="Paper", quantity=1, unit_price=500.0)],
+        tax=40.0,
+        total=540.0,
+    )
+    risk = RiskAssessment(risk_score=10.0, risk_level=RiskLevel.LOW, risk_factors=[], assessment_details={})
+    policy = PolicyCheckResult(
+        is_compliant=True, violated_policies=[], applied_exceptions=[], reasoning="Test", confidence=0.9
+    )
+
+    results = [
+        TransactionResult(
+            transaction_id=f"T-BULK-{i}",
+            invoice=invoice,
+            risk_assessment=risk,
+            policy_check=policy,
+            final_decision=DecisionType.APPROVED,
+            decision_reasoning="Test",
+            human_override=False,
+            processing_time_ms=50,
+            audit_trail=["Bulk"],
+            trace_id=f"trace-bulk-{i}",
+            created_at=datetime.now(),
+        )
+        for i in range(3)
+    ]
+
+    assert temp_db.save_transactions_bulk(results) == 3
+    assert temp_db.save_transactions_bulk([]) == 0
+
+    stored = temp_db.get_transaction("T-BULK-2")
+    assert stored is not None
+    assert stored["audit_trail"] == ["Bulk"]
+    assert len(temp_db.get_recent_transactions(limit=10)) == 3
+
+    slim = temp_db.get_recent_transactions(limit=10, columns=("transaction_id", "final_decision"))
+    assert all(set(row) == {"transaction_id", "final_decision"} for row in slim)
+    assert temp_db.get_transaction("T-BULK-2", columns=("trace_id",)) == {"trace_id": "trace-bulk-2"}
+    with pytest.raises(ValueError):
+        temp_db.get_transaction("T-BULK-2", columns=("trace_id; DROP TABLE transactions",))
+
+    _, oldest = temp_db.get_recent_transactions_columnar(limit=1, columns=("transaction_id",), oldest_first=True)
+    assert oldest == [("T-BULK-0",)]
+    decision_stats = temp_db.get_decision_stats()
+    assert decision_stats[DecisionType.APPROVED.value]["count"] == 3
+    assert decision_stats[DecisionType.APPROVED.value]["avg_risk_score"] == 10.0
+    assert decision_stats[DecisionType.APPROVED.value]["pending_hitl"] == 0
+
+
+def test_query_exceptions_keyset_pagination(temp_db):
+    """Pages fetched with limit/after_id cover every exception exactly once."""
+    for i in range(5):
+        temp_db.add_exception(
+            vendor="Paged Vendor", category="Software", rule_type="recurring", description=f"Rule {i}", condition={}
+        )
+
+    all_ids = [exc.exception_id for exc in temp_db.query_exceptions(MemoryQuery(vendor="Paged Vendor"))]
+
+    paged_ids = []
+    after_id = None
+    while True:
+        page = temp_db.query_exceptions(MemoryQuery(vendor="Paged Vendor", limit=2, after_id=after_id))
+        if not page:
+            break
+        assert len(page) <= 2
+        paged_ids.extend(exc.exception_id for exc in page)
+        after_id = page[-1].exception_id
+
+    assert paged_ids == all_ids
+    assert len(paged_ids) == 5
+
+
+def test_query_exceptions_cache_invalidated_by_other_instance(temp_db):
+    """Writes through another instance on the same file invalidate cached query results."""
+    query = MemoryQuery(vendor="Cached Vendor")
+    assert temp_db.query_exceptions(query) == []
+
+    other = MemoryDatabase(db_path=temp_db.db_path)
+    other.add_exception(
+        vendor="Cached Vendor", category="Software", rule_type="recurring", description="Cached rule", condition={}
+    )
+
+    exceptions = temp_db.query_exceptions(query)
+    assert len(exceptions) == 1
+    assert exceptions[0].description == "Cached rule"
+
+
+def test_query_exceptions_cache_returns_copies(temp_db):
+    """Mutating returned exceptions must not leak into later cached results."""
+    temp_db.add_exception(
+        vendor="Copy Vendor", category="Software", rule_type="recurring", description="Original", condition={"k": 1}
+    )
+    query = MemoryQuery(vendor="Copy Vendor")
+
+    first = temp_db.query_exceptions(query)
+    first[0].description = "Mutated"
+    first[0].condition["k"] = 2
+    first.clear()
+
+    cached = temp_db.query_exceptions(query)
+    assert len(cached) == 1
+    assert cached[0].description == "Original"
+    assert cached[0].condition == {"k": 1}
+
+
+def test_recompute_kpis_matches_per_day_calculation(temp_db):
+    """recompute_kpis saves the same figures as calculate_and_save_kpis for each day."""
+    invoice = Invoice(
+        invoice_id="KPI-001",
+        vendor="KPI Vendor",
+        vendor_reputation=70,
+        amount=200.0,
+        currency="USD",
+        category="Office",
+        date="2025-11-01",
+        po_number="PO-KPI",
+        line_items=[LineItem(description="Pens", quantity=1, unit_price=200.0)],
+        tax=0.0,
+        total=200.0,
+    )
+    risk = RiskAssessment(risk_score=20.0, risk_level=RiskLevel.LOW, risk_factors=[], assessment_details={})
+    policy = PolicyCheckResult(
+        is_compliant=True, violated_policies=[], applied_exceptions=[], reasoning="Test", confidence=0.9
+    )
+
+    days = {"2025-11-01": [False, True], "2025-11-02": [False]}
+    for day, overrides in days.items():
+        for i, human_override in enumerate(overrides):
+            temp_db.save_transaction(
+                TransactionResult(
+                    transaction_id=f"T-{day}-{i}",
+                    invoice=invoice,
+                    risk_assessment=risk,
+                    policy_check=policy,
+                    final_decision=DecisionType.APPROVED,
+                    decision_reasoning="Test",
+                    human_override=human_override,
+                    processing_time_ms=100 * (i + 1),
+                    audit_trail=["Trail"] if i == 0 else [],
+                    trace_id=f"trace-{day}-{i}",
+                    created_at=datetime.fromisoformat(f"{day} 12:00:00"),
+                )
+            )
+
+    recomputed = temp_db.recompute_kpis("2025-11-01", "2025-11-03")
+
+    assert [kpi.date for kpi in recomputed] == ["2025-11-02", "2025-11-01"]
+    for kpi in recomputed:
+        assert kpi == temp_db.calculate_and_save_kpis(kpi.date)
+
+
+def test_add_exceptions_bulk(temp_db):
+    """Bulk-added exceptions get unique ids in input order and are queryable."""
+    exception_ids = temp_db.add_exceptions_bulk(
+        [
+            {
+                "vendor": "Bulk Co",
+                "category": "Software",
+                "rule_type": "recurring",
+                "description": "First",
+                "condition": {},
+            },
+            {
+                "vendor": "Bulk Co",
+                "category": "Hardware",
+                "rule_type": "recurring",
+                "description": "n/a",
+                "condition": {},
+            },
+        ]
+    )
+
+    assert len(set(exception_ids)) == 2
+    stored = {exc.exception_id: exc for exc in temp_db.query_exceptions(MemoryQuery(vendor="Bulk Co"))}
+    assert stored[exception_ids[0]].description == "First"
+    assert stored[exception_ids[1]].description == "Recurring – Vendor Bulk Co"
+    assert temp_db.add_exceptions_bulk([]) == []
+
+
+def test_backfill_missing_descriptions(temp_db):
+    """Placeholder descriptions are rewritten the same way _normalize_description would."""
+    rows = [
+        ("reason", "Acme", "vendor_exception", "n/a", '{"reason": "  Known supplier "}'),
+        ("vendor", "Acme", "vendor_exception", "", "{}"),
+        ("rule", None, "threshold_rule", None, "not json"),
+        ("fallback", None, None, "NONE", '{"reason": 5}'),
+        ("kept", "Acme", "recurring", "Keep me", "{}"),
+    ]
+    with temp_db._write_conn() as conn:
+        conn.executemany(
+            """
+            INSERT INTO adaptive_memory (exception_id, vendor, rule_type, description, condition, created_at)
+            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """,
+            rows,
+        )
+
+    temp_db._backfill_missing_descriptions()
+
+    with temp_db._conn() as conn:
+        descriptions = dict(conn.execute("SELECT exception_id, description FROM adaptive_memory"))
+    for exception_id, vendor, rule_type, description, condition in rows:
+        try:
+            parsed = json.loads(condition)
+        except json.JSONDecodeError:
+            parsed = {}
+        assert descriptions[exception_id] == temp_db._normalize_description(description, vendor, parsed, rule_type)
+    assert descriptions["reason"] == "Known supplier"
+    assert descriptions["vendor"] == "Vendor Exception – Vendor Acme"
+
+
+def test_delete_and_restore_exceptions_bulk(temp_db):
+    """Bulk soft-delete/restore touch only rows in the matching state and report their ids."""
+    first, second = temp_db.add_exceptions_bulk(
+        [
+            {"vendor": "Bulk Delete", "category": "Software", "rule_type": "recurring", "description": "First"},
+            {"vendor": "Bulk Delete", "category": "Software", "rule_type": "recurring", "description": "Second"},
+        ]
+    )
+    query = MemoryQuery(vendor="Bulk Delete")
+    assert len(temp_db.query_exceptions(query)) == 2
+
+    assert sorted(temp_db.delete_exceptions([first, second, "missing"])) == sorted([first, second])
+    assert temp_db.query_exceptions(query) == []
+    assert temp_db.delete_exceptions([first]) == []
+    assert temp_db.delete_exception(first) is False
+
+    assert {exc["exception_id"] for exc in temp_db.get_deleted_exceptions()} == {first, second}
+    assert temp_db.get_deleted_exceptions()[0]["condition"] == {}
+
+    assert temp_db.restore_exceptions([second, "missing"]) == [second]
+    assert [exc.exception_id for exc in temp_db.query_exceptions(query)] == [second]
+    assert temp_db.restore_exception(first) is True
+    assert temp_db.delete_exceptions([]) == []
+
+
+def test_update_exceptions_usage(temp_db):
+    """Batched usage updates match applying update_exception_usage to each id."""
+    first, second = temp_db.add_exceptions_bulk(
+        [
+            {"vendor": "Usage Co", "category": "Software", "rule_type": "recurring", "description": "First"},
+            {"vendor": "Usage Co", "category": "Software", "rule_type": "recurring", "description": "Second"},
+        ]
+    )
+    temp_db.update_exception_usage(first, success=False)
+
+    assert temp_db.update_exceptions_usage([first, second, "missing"]) == 2
+    assert temp_db.update_exceptions_usage([]) == 0
+
+    stored = {exc.exception_id: exc for exc in temp_db.query_exceptions(MemoryQuery(vendor="Usage Co"))}
+    assert (stored[first].applied_count, stored[first].success_rate) == (2, 0.5)
+    assert (stored[second].applied_count, stored[second].success_rate) == (1, 1.0)
+    assert stored[second].last_applied_at is not None
@@ -0,0 +1,88 @@
+"""Unit tests for the Langfuse observability layer."""
+
+import threading
+
+import pytest
+
+import src.core.observability as observability
+from src.core.config import Settings, SettingsSnapshot
+
+
+class _StubObservation:
+    def end(self):
+        pass
+
+
+class _StubTrace:
+    def __init__(self, events, trace_id):
+        self.events = events
+        self.trace_id = trace_id
+
+    def span(self, **kwargs):
+        self.events.append(("span", self.trace_id, kwargs["name"]))
+        return _StubObservation()
+
+    generation = span
+
+    def update(self, **kwargs):
+        self.events.append(("update", self.trace_id, kwargs["output"]["status"]))
+
+    def end(self):
+        self.events.append(("end", self.trace_id, None))
+
+
+class _StubLangfuse:
+    events: list = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    def trace(self, name, **kwargs):
+        return _StubTrace(self.events, kwargs["metadata"]["trace_id"])
+
+    def flush(self):
+        pass
+
+
+@pytest.fixture
+def langfuse_stub(monkeypatch):
+    """Enable Langfuse with a stub client class."""
+    settings = Settings(openrouter_api_key="test-key", langfuse_public_key="pk", langfuse_secret_key="sk")
+    settings = SettingsSnapshot(**settings.model_dump())
+    monkeypatch.setattr(observability, "get_settings", lambda: settings)
+    monkeypatch.setattr(observability, "_LANGFUSE_AVAILABLE", True)
+    monkeypatch.setattr(observability, "_LANGFUSE_CLS", _StubLangfuse)
+    observability._get_langfuse_client.cache_clear()
+    _StubLangfuse.events = []
+    yield _StubLangfuse.events
+    observability._get_langfuse_client.cache_clear()
+
+
+def _drain_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "langfuse-drain"]
+
+
+def test_instances_share_one_drain_thread(langfuse_stub):
+    """Building many instances (one per request) reuses one thread and one Langfuse client."""
+    instances = [observability.Observability() for _ in range(20)]
+
+    assert all(obs.enabled for obs in instances)
+    assert len(_drain_threads()) == 1
+    assert len({id(obs.client) for obs in instances}) == 1
+
+
+def test_trace_ends_after_its_spans(langfuse_stub):
+    """The trace end is submitted by the drain thread after the spans queued before it."""
+    obs = observability.Observability()
+
+    with obs.trace("transaction_processing") as trace_id:
+        obs.log_agent_step(trace_id, "TAA", "assess_risk", {}, {})
+        obs.log_agent_step(trace_id, "PAA", "check_policy", {}, {})
+    observability.Observability().flush()
+
+    assert [(kind, name) for kind, _, name in langfuse_stub] == [
+        ("span", "TAA_assess_risk"),
+        ("span", "PAA_check_policy"),
+        ("update", "completed"),
+        ("end", None),
+    ]